@@ -136,18 +136,45 @@ class AsyncCompositeValidator(AsyncBaseValidator):
 
     async def _validate_concurrent(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """Run all validators concurrently."""
-        tasks = [validator.validate_async(output, context) for validator in self.validators]
-
         if self.short_circuit and self.operator == "AND":
-            # For AND with short circuit, use asyncio.gather with return_when=FIRST_EXCEPTION
-            # But we need custom logic since we want to stop on first validation failure
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Stop on the first validation failure, cancelling the rest
+            results = await self._gather_until_failure(output, context)
         else:
             # Run all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*(validator.validate_async(output, context) for validator in self.validators), return_exceptions=True)
 
         return self._combine_results(results)
 
+    async def _gather_until_failure(self, output: str, context: Optional[Dict[str, Any]] = None) -> List[Union[ValidationResult, BaseException]]:
+        """Run validators concurrently until one fails, cancelling any still running.
+
+        Unlike asyncio.gather, this doesn't wait for slow validators once the
+        AND result is already known to be invalid. Results are returned in
+        validator order, with cancelled validators as CancelledError.
+        """
+        tasks = [asyncio.ensure_future(validator.validate_async(output, context)) for validator in self.validators]
+        pending = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(not task.cancelled() and task.exception() is None and not task.result().is_valid for task in done):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Let cancelled validators finish unwinding before returning
+                await asyncio.wait(pending)
+
+        results: List[Union[ValidationResult, BaseException]] = []
+        for task in tasks:
+            if task.cancelled():
+                results.append(asyncio.CancelledError())
+            else:
+                results.append(task.exception() or task.result())
+        return results
+
     async def _validate_sequential(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """Run validators sequentially."""
         results = []
@@ -184,8 +211,11 @@ class AsyncCompositeValidator(AsyncBaseValidator):
         all_warnings: List[str] = []
         combined_metadata: Dict[str, Any] = {"operator": self.operator, "results": []}
 
-        for i, result in enumerate(valid_results):
-            validator_name = self.validators[i].name if i < len(self.validators) else f"validator_{i}"
+        # Results line up with validators; skip the ones that raised or were cancelled
+        for validator, result in zip(self.validators, results):
+            if not isinstance(result, ValidationResult):
+                continue
+            validator_name = validator.name
 
             # Prefix errors/warnings with validator name
             prefixed_errors = [f"[{validator_name}] {error}" for error in result.errors]
@@ -218,7 +248,14 @@ class AsyncFunctionValidator(AsyncBaseValidator):
     The function can be either sync or async.
     """
 
-    def __init__(self, func: Union[Callable[[str], bool], Callable[[str], Awaitable[bool]]], name: Optional[str] = None, description: str = "", error_message: str = "Validation failed"):
+    def __init__(
+        self,
+        func: Union[Callable[[str], bool], Callable[[str], Awaitable[bool]]],
+        name: Optional[str] = None,
+        description: str = "",
+        error_message: str = "Validation failed",
+        run_inline: bool = False,
+    ):
         """
         Initialize function-based async validator.
 
@@ -227,10 +264,13 @@ class AsyncFunctionValidator(AsyncBaseValidator):
             name: Validator name (defaults to function name)
             description: Validator description
             error_message: Error message when validation fails
+            run_inline: Call a sync function directly on the event loop instead of
+                in a thread pool; only suitable for cheap, non-blocking checks
         """
         self.func = func
         self.error_message = error_message
         self.is_async = asyncio.iscoroutinefunction(func)
+        self.run_inline = run_inline
 
         func_name = name or getattr(func, "__name__", "anonymous_function")
         if not isinstance(func_name, str):
@@ -242,6 +282,9 @@ class AsyncFunctionValidator(AsyncBaseValidator):
         try:
             if self.is_async:
                 is_valid = await self.func(output)  # type: ignore
+            elif self.run_inline:
+                # Cheap check: a thread pool hop would cost more than the call
+                is_valid = self.func(output)
             else:
                 # Run sync function in thread pool
                 loop = asyncio.get_event_loop()
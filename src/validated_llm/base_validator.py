@@ -66,6 +66,9 @@ class BaseValidator(ABC):
     and return a ValidationResult with detailed feedback.
     """
 
+    # Relative cost of one validate() call; composites allowed to reorder run cheaper validators first
+    cost_hint: float = 1.0
+
     def __init__(self, name: str, description: str = ""):
         self.name = name
         self.description = description
@@ -83,6 +86,23 @@ class BaseValidator(ABC):
             ValidationResult with validation status and detailed feedback
         """
 
+    def check_partial(self, partial_output: str, context: Optional[Dict[str, Any]] = None) -> Optional[ValidationResult]:
+        """
+        Check an incomplete LLM output while it is still being generated.
+
+        Used by streaming validation loops to stop generation as soon as the output
+        can no longer pass. Override this only for failures that no further output
+        could fix; the default never decides early.
+
+        Args:
+            partial_output: The output received so far
+            context: Optional context information for validation
+
+        Returns:
+            A failed ValidationResult if the output is already invalid, otherwise None
+        """
+        return None
+
     def get_source_code(self) -> str:
         """
         Get the source code of the validate method to include in LLM prompts.
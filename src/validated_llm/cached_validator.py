@@ -6,6 +6,7 @@ get intelligent caching of validation results with minimal code changes.
 """
 
 import hashlib
+import sys
 import time
 from typing import Any, Dict, Optional
 
@@ -46,13 +47,23 @@ class CachedValidatorMixin:
         self._cache_ttl = cache_ttl
         self._include_context_in_key = include_context_in_key
         self._cache_stats = {"validator_hits": 0, "validator_misses": 0, "cache_saves": 0}
+        # Built on first use, since subclasses may set their configuration after this __init__ runs
+        self._validator_id: Optional[str] = None
 
     def _get_validator_id(self) -> str:
         """Generate unique identifier for this validator instance.
 
         The ID includes the validator class and key configuration parameters
         to ensure cache isolation between different validator configurations.
+        It is computed once, on first use, so configuration is treated as fixed
+        from then on.
         """
+        if self._validator_id is None:
+            self._validator_id = sys.intern(self._build_validator_id())
+        return self._validator_id
+
+    def _build_validator_id(self) -> str:
+        """Build the validator ID from the class and its key configuration."""
         # Get base class name (the actual validator, not the mixin)
         class_name = self.__class__.__name__
 
@@ -148,7 +159,7 @@ class CachedValidatorMixin:
         validation_time = time.time() - start_time
 
         # Store result in cache
-        self._cache.put(validator_id, output, result, cache_context)
+        self._cache.put(validator_id, output, result, cache_context, ttl_seconds=self._cache_ttl)
         self._cache_stats["cache_saves"] += 1
 
         return result
@@ -16,6 +16,33 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+# Markdown code blocks with ``` or ```language
+_FENCE_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
+# Line comments in Python and in C-style languages
+_HASH_COMMENT_RE = re.compile(r"#\s*(.+)$")
+_SLASH_COMMENT_RE = re.compile(r"//\s*(.+)$")
+
+# Test harnesses wrapped around exported code; each test case is rendered into {body}
+_PY_TEMPLATE = """{code}
+
+# Test cases
+def test_function():
+    # Test the {func_name} function{body}
+
+if __name__ == '__main__':
+    test_function()
+    print('All tests passed!')"""
+
+_JS_TEMPLATE = """{code}
+
+// Test cases
+function {test_name}() {{
+{body}    console.log('All tests passed!');
+}}
+
+{test_name}();"""
+
 
 class CodeFormatter:
     """Base class for code format converters."""
@@ -33,16 +60,16 @@ class CodeFormatter:
         """
         blocks = []
 
-        # Markdown code blocks with ``` or ```language
-        pattern = r"```(\w*)\n(.*?)```"
-        matches = re.finditer(pattern, text, re.DOTALL)
+        # Markdown code blocks, counting newlines only since the previous match
+        line_number = 1
+        last_pos = 0
+        for match in _FENCE_RE.finditer(text):
+            line_number += text.count("\n", last_pos, match.start())
+            last_pos = match.start()
 
-        for match in matches:
             lang = match.group(1) or "text"
-            code = match.group(2).strip()
-
             if language is None or lang == language:
-                blocks.append({"code": code, "language": lang, "line_number": text[: match.start()].count("\n") + 1})
+                blocks.append({"code": match.group(2).strip(), "language": lang, "line_number": line_number})
 
         # Also check for indented code blocks (4 spaces)
         if not blocks:
@@ -168,18 +195,30 @@ class CodeImporter:
         Returns:
             List of code cells with metadata
         """
-        with open(notebook_path, "r") as f:
-            notebook = json.load(f)
+        return CodeImporter.from_jupyter_data(json.loads(Path(notebook_path).read_bytes()))
+
+    @staticmethod
+    def from_jupyter_data(notebook: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Import code from an already-parsed Jupyter notebook.
+
+        Args:
+            notebook: Notebook contents as loaded from JSON
+
+        Returns:
+            List of code cells with metadata
+        """
+        language = notebook.get("metadata", {}).get("kernelspec", {}).get("language", "python")
 
         code_cells = []
 
         for cell in notebook.get("cells", []):
             if cell["cell_type"] == "code":
-                source = "".join(cell["source"])
+                # nbformat allows source as a single string or a list of lines
+                source = cell["source"]
+                if not isinstance(source, str):
+                    source = "".join(source)
                 if source.strip():
-                    code_cells.append(
-                        {"code": source, "language": notebook.get("metadata", {}).get("kernelspec", {}).get("language", "python"), "metadata": cell.get("metadata", {}), "execution_count": cell.get("execution_count")}
-                    )
+                    code_cells.append({"code": source, "language": language, "metadata": cell.get("metadata", {}), "execution_count": cell.get("execution_count")})
 
         return code_cells
 
@@ -285,21 +324,9 @@ class CodeExporter:
         except:
             func_name = "function_under_test"
 
-        result = [function_code, "", "# Test cases", "def test_function():", f"    # Test the {func_name} function"]
-
-        for i, tc in enumerate(test_cases, 1):
-            input_val = tc.get("input", "")
-            expected = tc.get("expected", "")
-            result.append(f"    ")
-            result.append(f"    # Test case {i}")
-            result.append(f"    assert {func_name}({input_val}) == {expected}")
+        body = "".join(f"\n    \n    # Test case {i}\n    assert {func_name}({tc.get('input', '')}) == {tc.get('expected', '')}" for i, tc in enumerate(test_cases, 1))
 
-        result.append("")
-        result.append("if __name__ == '__main__':")
-        result.append("    test_function()")
-        result.append("    print('All tests passed!')")
-
-        return "\n".join(result)
+        return _PY_TEMPLATE.format(code=function_code, func_name=func_name, body=body)
 
     @staticmethod
     def _javascript_test_format(function_code: str, test_cases: List[Dict[str, Any]]) -> str:
@@ -308,20 +335,9 @@ class CodeExporter:
         match = re.search(r"function\s+(\w+)|const\s+(\w+)\s*=", function_code)
         func_name = (match.group(1) or match.group(2)) if match else "functionUnderTest"
 
-        result = [function_code, "", "// Test cases", f"function test{func_name.capitalize()}() {{"]
-
-        for i, tc in enumerate(test_cases, 1):
-            input_val = tc.get("input", "")
-            expected = tc.get("expected", "")
-            result.append(f"    // Test case {i}")
-            result.append(f"    console.assert({func_name}({input_val}) === {expected}, 'Test case {i} failed');")
+        body = "".join(f"    // Test case {i}\n    console.assert({func_name}({tc.get('input', '')}) === {tc.get('expected', '')}, 'Test case {i} failed');\n" for i, tc in enumerate(test_cases, 1))
 
-        result.append("    console.log('All tests passed!');")
-        result.append("}")
-        result.append("")
-        result.append(f"test{func_name.capitalize()}();")
-
-        return "\n".join(result)
+        return _JS_TEMPLATE.format(code=function_code, func_name=func_name, test_name=f"test{func_name.capitalize()}", body=body)
 
     @staticmethod
     def to_documentation_format(code: str, language: str = "python", include_comments: bool = True) -> Dict[str, Any]:
@@ -335,40 +351,35 @@ class CodeExporter:
         Returns:
             Dict with code structure and documentation
         """
-        doc = {"language": language, "functions": [], "classes": [], "imports": [], "global_vars": [], "comments": []}
+        functions: List[Dict[str, Any]] = []
+        classes: List[Dict[str, Any]] = []
+        imports: List[str] = []
+        comments: List[Dict[str, Any]] = []
+        doc = {"language": language, "functions": functions, "classes": classes, "imports": imports, "global_vars": [], "comments": comments}
 
         if language == "python":
             try:
                 tree = ast.parse(code)
 
+                # Collect functions, classes and imports in a single walk
                 for node in ast.walk(tree):
                     if isinstance(node, ast.FunctionDef):
-                        func_list = doc["functions"]
-                        assert isinstance(func_list, list)
-                        func_list.append({"name": node.name, "docstring": ast.get_docstring(node), "args": [arg.arg for arg in node.args.args], "line_number": node.lineno})
+                        functions.append({"name": node.name, "docstring": ast.get_docstring(node), "args": [arg.arg for arg in node.args.args], "line_number": node.lineno})
                     elif isinstance(node, ast.ClassDef):
-                        class_list = doc["classes"]
-                        assert isinstance(class_list, list)
-                        class_list.append({"name": node.name, "docstring": ast.get_docstring(node), "methods": [n.name for n in node.body if isinstance(n, ast.FunctionDef)], "line_number": node.lineno})
-                    elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                        if isinstance(node, ast.Import):
-                            imports = [alias.name for alias in node.names]
-                        else:
-                            imports = [f"from {node.module} import {', '.join(alias.name for alias in node.names)}"]
-                        import_list = doc["imports"]
-                        assert isinstance(import_list, list)
-                        import_list.extend(imports)
+                        classes.append({"name": node.name, "docstring": ast.get_docstring(node), "methods": [n.name for n in node.body if isinstance(n, ast.FunctionDef)], "line_number": node.lineno})
+                    elif isinstance(node, ast.Import):
+                        imports.extend(alias.name for alias in node.names)
+                    elif isinstance(node, ast.ImportFrom):
+                        imports.append(f"from {node.module} import {', '.join(alias.name for alias in node.names)}")
             except:
                 pass
 
         # Extract comments
         if include_comments:
-            comment_pattern = r"#\s*(.+)$" if language == "python" else r"//\s*(.+)$"
+            comment_re = _HASH_COMMENT_RE if language == "python" else _SLASH_COMMENT_RE
             for i, line in enumerate(code.split("\n"), 1):
-                match = re.search(comment_pattern, line)
+                match = comment_re.search(line)
                 if match:
-                    comment_list = doc["comments"]
-                    assert isinstance(comment_list, list)
-                    comment_list.append({"text": match.group(1), "line_number": i})
+                    comments.append({"text": match.group(1), "line_number": i})
 
         return doc
@@ -4,9 +4,11 @@ Configuration management for validated-llm framework.
 Supports loading configuration from .validated-llm.yml files for project-specific defaults.
 """
 
+import copy
 import dataclasses
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
@@ -14,6 +16,12 @@ import yaml
 
 from .error_formatting import ErrorCategory, create_enhanced_error
 
+try:
+    # libyaml's C parser is much faster when PyYAML was built against it
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[assignment]
+
 
 @dataclass
 class ValidatedLLMConfig:
@@ -91,6 +99,17 @@ class ValidatedLLMConfig:
                     setattr(self, field_name, other_value)
 
 
+@lru_cache(maxsize=64)
+def _parse_yaml_file(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its path, modification time and size.
+
+    The stat values are part of the key so an edited file is parsed again.
+    Callers must not mutate the returned data; it is shared between loads.
+    """
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=YamlSafeLoader)
+
+
 class ConfigLoader:
     """Loads and manages validated-llm configuration."""
 
@@ -167,12 +186,13 @@ class ConfigLoader:
         """Load global user configuration."""
         global_config_path = self.GLOBAL_CONFIG_DIR / "config.yml"
 
-        if global_config_path.exists():
-            try:
-                return self._load_config_file(global_config_path)
-            except Exception as e:
-                # Log warning but don't fail
-                print(f"Warning: Failed to load global config: {e}")
+        try:
+            return self._load_config_file(global_config_path)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except Exception as e:
+            # Log warning but don't fail
+            print(f"Warning: Failed to load global config: {e}")
 
         return None
 
@@ -189,13 +209,13 @@ class ConfigLoader:
         while current_path != current_path.parent:
             config_path = current_path / self.CONFIG_FILENAME
 
-            if config_path.exists():
-                # Load config file
-                try:
-                    config = self._load_config_file(config_path)
-                    return config
-                except Exception as e:
-                    raise ValueError(f"Invalid config at {config_path}: {e}")
+            # Try the read directly rather than checking existence first
+            try:
+                return self._load_config_file(config_path)
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            except Exception as e:
+                raise ValueError(f"Invalid config at {config_path}: {e}")
 
             current_path = current_path.parent
 
@@ -203,8 +223,7 @@ class ConfigLoader:
 
     def _load_config_file(self, path: Path) -> ValidatedLLMConfig:
         """Load configuration from a YAML file."""
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
+        data = self._read_yaml(path)
 
         if not isinstance(data, dict):
             raise ValueError(f"Config file must contain a YAML dictionary, got {type(data)}")
@@ -212,6 +231,12 @@ class ConfigLoader:
         # Validate and convert to config object
         return self._parse_config_dict(data)
 
+    def _read_yaml(self, path: Path) -> Any:
+        """Read and parse a YAML file, raising FileNotFoundError or NotADirectoryError if it doesn't exist."""
+        stat = path.stat()
+        # Copy the shared parse result since config objects keep references into it
+        return copy.deepcopy(_parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size))
+
     def _parse_config_dict(self, data: Dict[str, Any]) -> ValidatedLLMConfig:
         """Parse a configuration dictionary into ValidatedLLMConfig."""
         config = ValidatedLLMConfig()
@@ -73,6 +73,9 @@ class EnhancedValidationError:
 class ErrorFormatter:
     """Formats enhanced validation errors into human-readable messages."""
 
+    # Prefix shown before the main error line for each severity
+    _SEVERITY_SYMBOLS: Dict[ErrorSeverity, str] = {ErrorSeverity.ERROR: "❌", ErrorSeverity.WARNING: "⚠️", ErrorSeverity.INFO: "ℹ️"}
+
     @staticmethod
     def format_error(error: EnhancedValidationError, include_context: bool = True, max_width: int = 80) -> str:
         """
@@ -86,10 +89,15 @@ class ErrorFormatter:
         Returns:
             Formatted error message
         """
+        return "\n".join(ErrorFormatter._format_error_lines(error, include_context, max_width))
+
+    @staticmethod
+    def _format_error_lines(error: EnhancedValidationError, include_context: bool = True, max_width: int = 80) -> List[str]:
+        """Build the lines of a formatted error, so callers combining several errors can join once."""
         lines = []
 
         # Main error message with location
-        severity_symbol = {ErrorSeverity.ERROR: "❌", ErrorSeverity.WARNING: "⚠️", ErrorSeverity.INFO: "ℹ️"}.get(error.severity, "❌")
+        severity_symbol = ErrorFormatter._SEVERITY_SYMBOLS.get(error.severity, "❌")
 
         location_str = str(error.location) if error.location else ""
         main_line = f"{severity_symbol} {error.message}{location_str}"
@@ -141,7 +149,7 @@ class ErrorFormatter:
                     wrapped_lines.extend(ErrorFormatter._wrap_line(line, max_width))
             lines = wrapped_lines
 
-        return "\n".join(lines)
+        return lines
 
     @staticmethod
     def _wrap_line(line: str, max_width: int) -> List[str]:
@@ -189,7 +197,7 @@ class ErrorFormatter:
         shown_errors = errors[:max_errors]
         for i, error in enumerate(shown_errors, 1):
             lines.append(f"Error {i}:")
-            lines.append(ErrorFormatter.format_error(error, include_context=True))
+            lines.extend(ErrorFormatter._format_error_lines(error, include_context=True))
             if i < len(shown_errors):
                 lines.append("")
 
@@ -275,14 +283,19 @@ class ContextExtractor:
         Returns:
             Context with line numbers
         """
-        lines = text.split("\n")
-        if line_number < 1 or line_number > len(lines):
+        if line_number < 1:
             return ""
 
         # Calculate range (convert to 0-based indexing)
         error_line_idx = line_number - 1
         start_idx = max(0, error_line_idx - context_lines)
-        end_idx = min(len(lines), error_line_idx + context_lines + 1)
+        last_idx = error_line_idx + context_lines
+
+        # Only split as far as the last line shown; the unsplit remainder ends up in the final element
+        lines = text.split("\n", max(last_idx, error_line_idx) + 1)
+        if line_number > len(lines):
+            return ""
+        end_idx = min(len(lines), last_idx + 1)
 
         # Format with line numbers
         context_lines_formatted = []
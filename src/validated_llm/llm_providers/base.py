@@ -3,7 +3,7 @@ Base LLM provider abstraction.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Generator, Optional
 
 
 class LLMProvider(ABC):
@@ -53,3 +53,23 @@ class LLMProvider(ABC):
             Exception: If the LLM request fails
         """
         pass
+
+    def generate_stream(self, system_prompt: str, user_message: str) -> Generator[str, None, None]:
+        """
+        Generate a response from the LLM as a sequence of text chunks.
+
+        Providers that support streaming should override this so callers can stop
+        generation early by closing the generator. The default yields the whole
+        response from generate() as a single chunk.
+
+        Args:
+            system_prompt: The system prompt to set context/instructions
+            user_message: The user's message/query
+
+        Yields:
+            Consecutive pieces of the LLM's response
+
+        Raises:
+            Exception: If the LLM request fails
+        """
+        yield self.generate(system_prompt, user_message)
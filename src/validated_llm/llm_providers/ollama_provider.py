@@ -2,7 +2,7 @@
 Ollama provider implementation.
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, Generator, Optional
 
 from openai import OpenAI
 
@@ -62,22 +62,7 @@ class OllamaProvider(LLMProvider):
         Raises:
             Exception: If API request fails or Ollama is not available
         """
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ]
-
-        # Build request parameters
-        params = {
-            "model": self.model,
-            "messages": messages,
-            **self.extra_kwargs,
-        }
-
-        if self.temperature is not None:
-            params["temperature"] = self.temperature
-        if self.max_tokens is not None:
-            params["max_tokens"] = self.max_tokens
+        params = self._build_params(system_prompt, user_message)
 
         try:
             # Make API request to Ollama
@@ -94,11 +79,67 @@ class OllamaProvider(LLMProvider):
             return str(content)
 
         except Exception as e:
-            # Provide helpful error message for common Ollama issues
-            error_msg = str(e).lower()
-            if "connection" in error_msg or "refused" in error_msg:
-                raise ConnectionError(f"Cannot connect to Ollama at {self.client.base_url}. " "Make sure Ollama is running (try: ollama serve)") from e
-            elif "not found" in error_msg or "does not exist" in error_msg:
-                raise ValueError(f"Model '{self.model}' not found in Ollama. " f"Try: ollama pull {self.model}") from e
-            else:
-                raise
+            raise self._translate_error(e)
+
+    def generate_stream(self, system_prompt: str, user_message: str) -> Generator[str, None, None]:
+        """
+        Stream a response from the Ollama API chunk by chunk.
+
+        Closing the generator closes the HTTP response, which stops Ollama generating
+        the rest of the reply.
+
+        Args:
+            system_prompt: System prompt for context/instructions
+            user_message: User's message/query
+
+        Yields:
+            Consecutive pieces of the response content
+
+        Raises:
+            Exception: If API request fails or Ollama is not available
+        """
+        params = self._build_params(system_prompt, user_message)
+
+        try:
+            stream = self.client.chat.completions.create(stream=True, **params)
+        except Exception as e:
+            raise self._translate_error(e)
+
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
+    def _build_params(self, system_prompt: str, user_message: str) -> Dict[str, Any]:
+        """Build chat completion request parameters."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ]
+
+        params = {
+            "model": self.model,
+            "messages": messages,
+            **self.extra_kwargs,
+        }
+
+        if self.temperature is not None:
+            params["temperature"] = self.temperature
+        if self.max_tokens is not None:
+            params["max_tokens"] = self.max_tokens
+
+        return params
+
+    def _translate_error(self, error: Exception) -> Exception:
+        """Provide helpful error messages for common Ollama issues."""
+        error_msg = str(error).lower()
+        if "connection" in error_msg or "refused" in error_msg:
+            new_error: Exception = ConnectionError(f"Cannot connect to Ollama at {self.client.base_url}. " "Make sure Ollama is running (try: ollama serve)")
+        elif "not found" in error_msg or "does not exist" in error_msg:
+            new_error = ValueError(f"Model '{self.model}' not found in Ollama. " f"Try: ollama pull {self.model}")
+        else:
+            return error
+        new_error.__cause__ = error
+        return new_error
@@ -4,6 +4,7 @@ Plugin discovery mechanisms for finding and loading validator plugins.
 
 import importlib
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple
@@ -53,11 +54,19 @@ class PluginDiscovery:
         if not directory.exists() or not directory.is_dir():
             return
 
-        # Look for Python files
-        for py_file in directory.glob("*.py"):
-            if py_file.name.startswith("__"):
-                continue
-
+        # List the directory once, collecting plugin modules and packages
+        py_files: List[Path] = []
+        pkg_dirs: List[Path] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        pkg_dirs.append(Path(entry.path))
+                elif entry.name.endswith(".py") and not entry.name.startswith(("__", ".")):
+                    py_files.append(Path(entry.path))
+
+        # Load Python files
+        for py_file in py_files:
             try:
                 plugin = self._load_plugin_from_file(py_file)
                 if plugin:
@@ -66,15 +75,14 @@ class PluginDiscovery:
                 # Log warning but continue
                 print(f"Warning: Failed to load plugin from {py_file}: {e}")
 
-        # Look for package directories
-        for pkg_dir in directory.iterdir():
-            if pkg_dir.is_dir() and (pkg_dir / "__init__.py").exists():
-                try:
-                    plugin = self._load_plugin_from_package(pkg_dir)
-                    if plugin:
-                        yield plugin
-                except Exception as e:
-                    print(f"Warning: Failed to load plugin from {pkg_dir}: {e}")
+        # Load package directories
+        for pkg_dir in pkg_dirs:
+            try:
+                plugin = self._load_plugin_from_package(pkg_dir)
+                if plugin:
+                    yield plugin
+            except Exception as e:
+                print(f"Warning: Failed to load plugin from {pkg_dir}: {e}")
 
     def discover_from_namespace(self, namespace: str) -> Generator[ValidationPlugin, None, None]:
         """
@@ -4,18 +4,27 @@ Plugin registry for managing validator plugins.
 
 import importlib
 import inspect
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 from ..base_validator import BaseValidator
 from .exceptions import PluginError, PluginRegistrationError, PluginValidationError
 
+# Validator classes that already passed validation, so re-registering them
+# skips the subclass and signature checks. Held weakly so classes from
+# unloaded plugin modules can still be garbage collected.
+_validated_classes: "weakref.WeakSet[type]" = weakref.WeakSet()
 
-@dataclass
+
+@dataclass(frozen=True)
 class ValidationPlugin:
     """
     Metadata for a validation plugin.
+
+    Plugins are immutable and hashable, so they can be deduplicated in sets
+    or used as dict keys. Dependencies and tags are stored as tuples.
     """
 
     name: str
@@ -23,15 +32,13 @@ class ValidationPlugin:
     description: str
     author: str
     validator_class: Type[BaseValidator]
-    dependencies: Optional[List[str]] = None
-    tags: Optional[List[str]] = None
+    dependencies: Optional[Sequence[str]] = None
+    tags: Optional[Sequence[str]] = None
     plugin_module: Optional[str] = None
 
     def __post_init__(self) -> None:
-        if self.dependencies is None:
-            self.dependencies = []
-        if self.tags is None:
-            self.tags = []
+        object.__setattr__(self, "dependencies", tuple(self.dependencies or ()))
+        object.__setattr__(self, "tags", tuple(self.tags or ()))
 
 
 class PluginRegistry:
@@ -44,6 +51,8 @@ class PluginRegistry:
 
     def __init__(self) -> None:
         self._plugins: Dict[str, ValidationPlugin] = {}
+        # Tag -> plugins carrying it, in registration order, for tag listing
+        self._plugins_by_tag: Dict[str, Dict[str, ValidationPlugin]] = {}
         self._loaded_modules: Dict[str, Any] = {}
 
     def register_plugin(self, plugin: ValidationPlugin) -> None:
@@ -66,6 +75,8 @@ class PluginRegistry:
 
         # Register the plugin
         self._plugins[plugin.name] = plugin
+        for tag in plugin.tags or []:
+            self._plugins_by_tag.setdefault(tag, {})[plugin.name] = plugin
 
     def register_validator_class(
         self, validator_class: Type[BaseValidator], name: str, version: str = "1.0.0", description: str = "", author: str = "Unknown", dependencies: Optional[List[str]] = None, tags: Optional[List[str]] = None
@@ -100,10 +111,17 @@ class PluginRegistry:
         Returns:
             True if plugin was unregistered, False if not found
         """
-        if name in self._plugins:
-            del self._plugins[name]
-            return True
-        return False
+        plugin = self._plugins.pop(name, None)
+        if plugin is None:
+            return False
+
+        for tag in plugin.tags or []:
+            tagged = self._plugins_by_tag.get(tag)
+            if tagged is not None:
+                tagged.pop(name, None)
+                if not tagged:
+                    del self._plugins_by_tag[tag]
+        return True
 
     def get_plugin(self, name: str) -> Optional[ValidationPlugin]:
         """
@@ -127,12 +145,10 @@ class PluginRegistry:
         Returns:
             List of plugins
         """
-        plugins = list(self._plugins.values())
-
         if tag:
-            plugins = [p for p in plugins if tag in (p.tags or [])]
+            return list(self._plugins_by_tag.get(tag, {}).values())
 
-        return plugins
+        return list(self._plugins.values())
 
     def create_validator(self, name: str, **kwargs: Any) -> BaseValidator:
         """
@@ -181,6 +197,9 @@ class PluginRegistry:
         if not inspect.isclass(plugin.validator_class):
             raise PluginValidationError("validator_class must be a class")
 
+        if plugin.validator_class in _validated_classes:
+            return
+
         if not issubclass(plugin.validator_class, BaseValidator):
             raise PluginValidationError("validator_class must inherit from BaseValidator")
 
@@ -197,6 +216,8 @@ class PluginRegistry:
         except Exception as e:
             raise PluginValidationError(f"Invalid validator class: {e}")
 
+        _validated_classes.add(plugin.validator_class)
+
     def get_plugin_info(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a plugin.
@@ -216,8 +237,8 @@ class PluginRegistry:
             "version": plugin.version,
             "description": plugin.description,
             "author": plugin.author,
-            "dependencies": plugin.dependencies,
-            "tags": plugin.tags,
+            "dependencies": list(plugin.dependencies or ()),
+            "tags": list(plugin.tags or ()),
             "validator_class": plugin.validator_class.__name__,
             "module": plugin.plugin_module,
         }
@@ -225,6 +246,7 @@ class PluginRegistry:
     def clear(self) -> None:
         """Clear all registered plugins."""
         self._plugins.clear()
+        self._plugins_by_tag.clear()
         self._loaded_modules.clear()
 
 
@@ -2,7 +2,7 @@
 Code refactoring task for improving existing code while preserving functionality.
 """
 
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
 from validated_llm.base_validator import BaseValidator
 from validated_llm.tasks import BaseTask
@@ -53,6 +53,10 @@ class CodeRefactoringTask(BaseTask):
         # Validator will be configured with original code during execution
         self._validator_config = {"language": language, "check_complexity": check_complexity, "check_naming": check_naming, "check_structure": check_structure, "max_complexity": max_complexity}
 
+        # Rendered prompt template, rebuilt only when the settings it depends on change
+        self._prompt_template: Optional[str] = None
+        self._prompt_template_key: Optional[Tuple[str, int, str]] = None
+
     @property
     def name(self) -> str:
         """Human-readable name for this task."""
@@ -66,6 +70,14 @@ class CodeRefactoringTask(BaseTask):
     @property
     def prompt_template(self) -> str:
         """Get the prompt template for code refactoring."""
+        key = (self.language, self.max_complexity, self.refactoring_style)
+        if self._prompt_template is None or self._prompt_template_key != key:
+            self._prompt_template = self._build_prompt_template()
+            self._prompt_template_key = key
+        return self._prompt_template
+
+    def _build_prompt_template(self) -> str:
+        """Build the prompt template for code refactoring."""
         style_instructions = self._get_style_instructions()
 
         return f"""Refactor the following {self.language} code to improve its quality:
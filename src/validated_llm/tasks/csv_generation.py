@@ -98,14 +98,13 @@ class CSVValidator(BaseValidator):
             if self.max_rows and len(data_rows) > self.max_rows:
                 errors.append(f"Too many data rows: {len(data_rows)}, maximum allowed: {self.max_rows}")
 
-            # Check for consistent column count
+            # Check for consistent column count and empty cells (warning only)
+            # in a single pass over the data rows
             expected_cols = len(header)
             for i, row in enumerate(data_rows, 1):
                 if len(row) != expected_cols:
                     errors.append(f"Row {i} has {len(row)} columns, expected {expected_cols}")
 
-            # Check for empty cells (warning only)
-            for i, row in enumerate(data_rows, 1):
                 for j, cell in enumerate(row):
                     if not cell.strip():
                         warnings.append(f"Empty cell at row {i}, column {j+1}")
@@ -47,6 +47,9 @@ from validated_llm.tasks.base_task import BaseTask
 class ListValidator(BaseValidator):
     """Validates list output format."""
 
+    # First characters that mark a list item ("-", "*" or a number)
+    LIST_MARKERS = frozenset("-*0123456789")
+
     def __init__(self, min_items: int = 1, max_items: int = 100, item_pattern: Optional[str] = None):
         super().__init__(name="list_validator", description="Validates list format and structure")
         self.min_items = min_items
@@ -57,7 +60,8 @@ class ListValidator(BaseValidator):
         errors = []
         warnings = []
 
-        lines = [line.strip() for line in content.strip().split("\n") if line.strip()]
+        # Strip each line once, dropping blank ones
+        lines = [stripped for line in content.split("\n") if (stripped := line.strip())]
 
         # Check item count
         if len(lines) < self.min_items:
@@ -67,7 +71,7 @@ class ListValidator(BaseValidator):
 
         # Check item format
         for i, line in enumerate(lines, 1):
-            if not (line.startswith(("1.", "2.", "3.", "4.", "5.", "6.", "7.", "8.", "9.", "*", "-")) or line[0].isdigit()):
+            if line[0] not in self.LIST_MARKERS and not line[0].isdigit():
                 warnings.append(f"Line {i} doesn't follow list format")
 
         return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings, metadata={"item_count": len(lines)})
@@ -4,7 +4,7 @@ Software engineering tasks for project analysis, requirements generation, and us
 
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..base_validator import BaseValidator
 from ..validators.composite import CompositeValidator
@@ -38,6 +38,290 @@ class RequirementType(Enum):
     SYSTEM = "system"
 
 
+# Default task settings, shared by every instance that doesn't override them
+_DEFAULT_ANALYSIS_TYPES: Tuple[AnalysisType, ...] = (AnalysisType.ARCHITECTURE, AnalysisType.SECURITY, AnalysisType.MAINTAINABILITY, AnalysisType.QUALITY)
+_DEFAULT_SEVERITY_LEVELS: Tuple[str, ...] = ("critical", "high", "medium")
+_DEFAULT_REQUIREMENT_TYPES: Tuple[RequirementType, ...] = (RequirementType.FUNCTIONAL, RequirementType.NON_FUNCTIONAL, RequirementType.TECHNICAL)
+_DEFAULT_STAKEHOLDERS: Tuple[str, ...] = ("end_users", "developers", "product_owner")
+_DEFAULT_PERSONA_TYPES: Tuple[str, ...] = ("end_user", "administrator", "manager", "developer", "support_staff")
+
+
+# JSON schema for analysis reports; shared by every task instance, so treat it as read-only
+_ANALYSIS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project_overview": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "language": {"type": "string"},
+                "type": {"type": "string"},
+                "size": {"type": "string"},
+                "complexity": {"type": "string", "enum": ["low", "medium", "high"]},
+                "description": {"type": "string"},
+            },
+            "required": ["name", "language", "type", "description"],
+        },
+        "analysis_results": {
+            "type": "object",
+            "properties": {
+                "architecture": {
+                    "type": "object",
+                    "properties": {
+                        "patterns": {"type": "array", "items": {"type": "string"}},
+                        "issues": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "severity": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                                    "category": {"type": "string"},
+                                    "description": {"type": "string"},
+                                    "location": {"type": "string"},
+                                    "recommendation": {"type": "string"},
+                                },
+                                "required": ["severity", "category", "description"],
+                            },
+                        },
+                        "score": {"type": "number", "minimum": 0, "maximum": 10},
+                    },
+                },
+                "security": {
+                    "type": "object",
+                    "properties": {
+                        "vulnerabilities": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "type": {"type": "string"},
+                                    "severity": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                                    "description": {"type": "string"},
+                                    "file": {"type": "string"},
+                                    "line": {"type": ["integer", "null"]},
+                                    "mitigation": {"type": "string"},
+                                },
+                                "required": ["type", "severity", "description", "mitigation"],
+                            },
+                        },
+                        "security_score": {"type": "number", "minimum": 0, "maximum": 10},
+                    },
+                },
+                "quality": {
+                    "type": "object",
+                    "properties": {
+                        "metrics": {
+                            "type": "object",
+                            "properties": {"maintainability_index": {"type": "number"}, "cyclomatic_complexity": {"type": "number"}, "code_duplication": {"type": "number"}, "test_coverage": {"type": "number"}},
+                        },
+                        "issues": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {"type": {"type": "string"}, "description": {"type": "string"}, "file": {"type": "string"}, "suggestion": {"type": "string"}},
+                                "required": ["type", "description", "suggestion"],
+                            },
+                        },
+                        "quality_score": {"type": "number", "minimum": 0, "maximum": 10},
+                    },
+                },
+            },
+        },
+        "recommendations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "category": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "impact": {"type": "string"},
+                    "effort": {"type": "string", "enum": ["low", "medium", "high"]},
+                    "timeline": {"type": "string"},
+                },
+                "required": ["category", "priority", "title", "description", "impact"],
+            },
+        },
+        "summary": {
+            "type": "object",
+            "properties": {
+                "overall_score": {"type": "number", "minimum": 0, "maximum": 10},
+                "key_strengths": {"type": "array", "items": {"type": "string"}},
+                "critical_issues": {"type": "array", "items": {"type": "string"}},
+                "next_steps": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["overall_score", "key_strengths", "critical_issues", "next_steps"],
+        },
+    },
+    "required": ["project_overview", "analysis_results", "summary"],
+}
+
+
+# JSON schema for requirements documents; shared by every task instance, so treat it as read-only
+_REQUIREMENTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "document_info": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "version": {"type": "string"},
+                "date": {"type": "string"},
+                "authors": {"type": "array", "items": {"type": "string"}},
+                "stakeholders": {"type": "array", "items": {"type": "string"}},
+                "project_overview": {"type": "string"},
+            },
+            "required": ["title", "version", "project_overview"],
+        },
+        "functional_requirements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                    "complexity": {"type": "string", "enum": ["low", "medium", "high"]},
+                    "acceptance_criteria": {"type": "array", "items": {"type": "string"}},
+                    "dependencies": {"type": "array", "items": {"type": "string"}},
+                    "stakeholder": {"type": "string"},
+                },
+                "required": ["id", "title", "description", "priority"],
+            },
+            "minItems": 1,
+        },
+        "non_functional_requirements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "category": {"type": "string"},
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "metric": {"type": "string"},
+                    "target_value": {"type": "string"},
+                    "measurement_method": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                },
+                "required": ["id", "category", "title", "description", "metric"],
+            },
+        },
+        "technical_requirements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "category": {"type": "string"},
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "technology": {"type": "string"},
+                    "justification": {"type": "string"},
+                    "constraints": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["id", "category", "title", "description"],
+            },
+        },
+        "traceability_matrix": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "requirement_id": {"type": "string"},
+                    "business_objective": {"type": "string"},
+                    "user_story": {"type": "string"},
+                    "test_case": {"type": "string"},
+                    "implementation": {"type": "string"},
+                },
+                "required": ["requirement_id", "business_objective"],
+            },
+        },
+    },
+    "required": ["document_info", "functional_requirements"],
+}
+
+
+# JSON schema for user story backlogs; shared by every task instance, so treat it as read-only
+_STORY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "backlog_info": {
+            "type": "object",
+            "properties": {
+                "product_name": {"type": "string"},
+                "version": {"type": "string"},
+                "created_date": {"type": "string"},
+                "product_owner": {"type": "string"},
+                "development_team": {"type": "string"},
+                "sprint_capacity": {"type": "number"},
+            },
+            "required": ["product_name", "version"],
+        },
+        "personas": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "role": {"type": "string"},
+                    "description": {"type": "string"},
+                    "goals": {"type": "array", "items": {"type": "string"}},
+                    "pain_points": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["name", "role", "description"],
+            },
+        },
+        "epics": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "business_value": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                    "estimated_effort": {"type": "string"},
+                },
+                "required": ["id", "title", "description"],
+            },
+        },
+        "user_stories": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "epic_id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "story": {"type": "string"},
+                    "persona": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
+                    "story_points": {"type": "integer", "minimum": 1, "maximum": 21},
+                    "business_value": {"type": "string"},
+                    "acceptance_criteria": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {"scenario": {"type": "string"}, "given": {"type": "string"}, "when": {"type": "string"}, "then": {"type": "string"}},
+                            "required": ["scenario", "given", "when", "then"],
+                        },
+                    },
+                    "dependencies": {"type": "array", "items": {"type": "string"}},
+                    "notes": {"type": "string"},
+                },
+                "required": ["id", "title", "story", "persona", "priority"],
+            },
+            "minItems": 1,
+        },
+    },
+    "required": ["backlog_info", "user_stories"],
+}
+
+
 class CodebaseAnalysisTask(BaseTask):
     """
     Analyze codebases for patterns, issues, and improvements.
@@ -80,13 +364,13 @@ class CodebaseAnalysisTask(BaseTask):
             max_issues_per_category: Maximum issues per category
             **validator_kwargs: Additional validator configuration
         """
-        self.analysis_types = analysis_types or [AnalysisType.ARCHITECTURE, AnalysisType.SECURITY, AnalysisType.MAINTAINABILITY, AnalysisType.QUALITY]
+        self.analysis_types: Sequence[AnalysisType] = analysis_types or _DEFAULT_ANALYSIS_TYPES
         self.project_language = project_language
         self.project_type = project_type
         self.include_dependencies = include_dependencies
         self.include_metrics = include_metrics
         self.include_recommendations = include_recommendations
-        self.severity_levels = severity_levels or ["critical", "high", "medium"]
+        self.severity_levels: Sequence[str] = severity_levels or _DEFAULT_SEVERITY_LEVELS
         self.output_format = output_format
         self.max_issues_per_category = max_issues_per_category
 
@@ -102,116 +386,8 @@ class CodebaseAnalysisTask(BaseTask):
         self._prompt_template = self._build_prompt_template()
 
     def _build_analysis_schema(self) -> Dict[str, Any]:
-        """Build JSON schema for analysis report validation."""
-        return {
-            "type": "object",
-            "properties": {
-                "project_overview": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "language": {"type": "string"},
-                        "type": {"type": "string"},
-                        "size": {"type": "string"},
-                        "complexity": {"type": "string", "enum": ["low", "medium", "high"]},
-                        "description": {"type": "string"},
-                    },
-                    "required": ["name", "language", "type", "description"],
-                },
-                "analysis_results": {
-                    "type": "object",
-                    "properties": {
-                        "architecture": {
-                            "type": "object",
-                            "properties": {
-                                "patterns": {"type": "array", "items": {"type": "string"}},
-                                "issues": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "severity": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                                            "category": {"type": "string"},
-                                            "description": {"type": "string"},
-                                            "location": {"type": "string"},
-                                            "recommendation": {"type": "string"},
-                                        },
-                                        "required": ["severity", "category", "description"],
-                                    },
-                                },
-                                "score": {"type": "number", "minimum": 0, "maximum": 10},
-                            },
-                        },
-                        "security": {
-                            "type": "object",
-                            "properties": {
-                                "vulnerabilities": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "type": {"type": "string"},
-                                            "severity": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                                            "description": {"type": "string"},
-                                            "file": {"type": "string"},
-                                            "line": {"type": ["integer", "null"]},
-                                            "mitigation": {"type": "string"},
-                                        },
-                                        "required": ["type", "severity", "description", "mitigation"],
-                                    },
-                                },
-                                "security_score": {"type": "number", "minimum": 0, "maximum": 10},
-                            },
-                        },
-                        "quality": {
-                            "type": "object",
-                            "properties": {
-                                "metrics": {
-                                    "type": "object",
-                                    "properties": {"maintainability_index": {"type": "number"}, "cyclomatic_complexity": {"type": "number"}, "code_duplication": {"type": "number"}, "test_coverage": {"type": "number"}},
-                                },
-                                "issues": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {"type": {"type": "string"}, "description": {"type": "string"}, "file": {"type": "string"}, "suggestion": {"type": "string"}},
-                                        "required": ["type", "description", "suggestion"],
-                                    },
-                                },
-                                "quality_score": {"type": "number", "minimum": 0, "maximum": 10},
-                            },
-                        },
-                    },
-                },
-                "recommendations": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "category": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["high", "medium", "low"]},
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "impact": {"type": "string"},
-                            "effort": {"type": "string", "enum": ["low", "medium", "high"]},
-                            "timeline": {"type": "string"},
-                        },
-                        "required": ["category", "priority", "title", "description", "impact"],
-                    },
-                },
-                "summary": {
-                    "type": "object",
-                    "properties": {
-                        "overall_score": {"type": "number", "minimum": 0, "maximum": 10},
-                        "key_strengths": {"type": "array", "items": {"type": "string"}},
-                        "critical_issues": {"type": "array", "items": {"type": "string"}},
-                        "next_steps": {"type": "array", "items": {"type": "string"}},
-                    },
-                    "required": ["overall_score", "key_strengths", "critical_issues", "next_steps"],
-                },
-            },
-            "required": ["project_overview", "analysis_results", "summary"],
-        }
+        """Return the JSON schema for analysis report validation."""
+        return _ANALYSIS_SCHEMA
 
     def _build_prompt_template(self) -> str:
         """Build the prompt template for codebase analysis."""
@@ -427,10 +603,10 @@ class RequirementsTask(BaseTask):
             min_requirements_per_type: Minimum requirements per type
             **validator_kwargs: Additional validator configuration
         """
-        self.requirement_types = requirement_types or [RequirementType.FUNCTIONAL, RequirementType.NON_FUNCTIONAL, RequirementType.TECHNICAL]
+        self.requirement_types: Sequence[RequirementType] = requirement_types or _DEFAULT_REQUIREMENT_TYPES
         self.project_type = project_type
-        self.stakeholders = stakeholders or ["end_users", "developers", "product_owner"]
-        self.compliance_standards = compliance_standards or []
+        self.stakeholders: Sequence[str] = stakeholders or _DEFAULT_STAKEHOLDERS
+        self.compliance_standards: Sequence[str] = compliance_standards or ()
         self.include_acceptance_criteria = include_acceptance_criteria
         self.include_priorities = include_priorities
         self.include_traceability = include_traceability
@@ -449,90 +625,8 @@ class RequirementsTask(BaseTask):
         self._prompt_template = self._build_prompt_template()
 
     def _build_requirements_schema(self) -> Dict[str, Any]:
-        """Build JSON schema for requirements document validation."""
-        return {
-            "type": "object",
-            "properties": {
-                "document_info": {
-                    "type": "object",
-                    "properties": {
-                        "title": {"type": "string"},
-                        "version": {"type": "string"},
-                        "date": {"type": "string"},
-                        "authors": {"type": "array", "items": {"type": "string"}},
-                        "stakeholders": {"type": "array", "items": {"type": "string"}},
-                        "project_overview": {"type": "string"},
-                    },
-                    "required": ["title", "version", "project_overview"],
-                },
-                "functional_requirements": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                            "complexity": {"type": "string", "enum": ["low", "medium", "high"]},
-                            "acceptance_criteria": {"type": "array", "items": {"type": "string"}},
-                            "dependencies": {"type": "array", "items": {"type": "string"}},
-                            "stakeholder": {"type": "string"},
-                        },
-                        "required": ["id", "title", "description", "priority"],
-                    },
-                    "minItems": 1,
-                },
-                "non_functional_requirements": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "category": {"type": "string"},
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "metric": {"type": "string"},
-                            "target_value": {"type": "string"},
-                            "measurement_method": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                        },
-                        "required": ["id", "category", "title", "description", "metric"],
-                    },
-                },
-                "technical_requirements": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "category": {"type": "string"},
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "technology": {"type": "string"},
-                            "justification": {"type": "string"},
-                            "constraints": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["id", "category", "title", "description"],
-                    },
-                },
-                "traceability_matrix": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "requirement_id": {"type": "string"},
-                            "business_objective": {"type": "string"},
-                            "user_story": {"type": "string"},
-                            "test_case": {"type": "string"},
-                            "implementation": {"type": "string"},
-                        },
-                        "required": ["requirement_id", "business_objective"],
-                    },
-                },
-            },
-            "required": ["document_info", "functional_requirements"],
-        }
+        """Return the JSON schema for requirements document validation."""
+        return _REQUIREMENTS_SCHEMA
 
     def _build_prompt_template(self) -> str:
         """Build the prompt template for requirements generation."""
@@ -753,7 +847,7 @@ class UserStoryTask(BaseTask):
         self.include_story_points = include_story_points
         self.include_dependencies = include_dependencies
         self.include_business_value = include_business_value
-        self.persona_types = persona_types or ["end_user", "administrator", "manager", "developer", "support_staff"]
+        self.persona_types: Sequence[str] = persona_types or _DEFAULT_PERSONA_TYPES
         self.epic_organization = epic_organization
         self.output_format = output_format
         self.min_stories = min_stories
@@ -771,82 +865,8 @@ class UserStoryTask(BaseTask):
         self._prompt_template = self._build_prompt_template()
 
     def _build_story_schema(self) -> Dict[str, Any]:
-        """Build JSON schema for user story validation."""
-        return {
-            "type": "object",
-            "properties": {
-                "backlog_info": {
-                    "type": "object",
-                    "properties": {
-                        "product_name": {"type": "string"},
-                        "version": {"type": "string"},
-                        "created_date": {"type": "string"},
-                        "product_owner": {"type": "string"},
-                        "development_team": {"type": "string"},
-                        "sprint_capacity": {"type": "number"},
-                    },
-                    "required": ["product_name", "version"],
-                },
-                "personas": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "role": {"type": "string"},
-                            "description": {"type": "string"},
-                            "goals": {"type": "array", "items": {"type": "string"}},
-                            "pain_points": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["name", "role", "description"],
-                    },
-                },
-                "epics": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "business_value": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                            "estimated_effort": {"type": "string"},
-                        },
-                        "required": ["id", "title", "description"],
-                    },
-                },
-                "user_stories": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "epic_id": {"type": "string"},
-                            "title": {"type": "string"},
-                            "story": {"type": "string"},
-                            "persona": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["critical", "high", "medium", "low"]},
-                            "story_points": {"type": "integer", "minimum": 1, "maximum": 21},
-                            "business_value": {"type": "string"},
-                            "acceptance_criteria": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {"scenario": {"type": "string"}, "given": {"type": "string"}, "when": {"type": "string"}, "then": {"type": "string"}},
-                                    "required": ["scenario", "given", "when", "then"],
-                                },
-                            },
-                            "dependencies": {"type": "array", "items": {"type": "string"}},
-                            "notes": {"type": "string"},
-                        },
-                        "required": ["id", "title", "story", "persona", "priority"],
-                    },
-                    "minItems": 1,
-                },
-            },
-            "required": ["backlog_info", "user_stories"],
-        }
+        """Return the JSON schema for user story validation."""
+        return _STORY_SCHEMA
 
     def _build_prompt_template(self) -> str:
         """Build the prompt template for user story generation."""
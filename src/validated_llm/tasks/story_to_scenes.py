@@ -5,14 +5,21 @@ This task converts narrative stories into structured video scene YAML files.
 It combines the prompt template and validator in a single cohesive unit.
 """
 
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type
 
 import yaml
 
 from ..base_validator import BaseValidator, ValidationResult
+from ..config import YamlSafeLoader
 from .base_task import BaseTask
 
+# Words that belong in the image 'style' field rather than the prompt, in the order they are reported
+STYLE_KEYWORDS = ("photorealistic", "cinematic", "artistic", "style")
+# A zero-width lookahead so keywords that overlap, as in "artisticinematic", are all found
+_STYLE_KEYWORD_RE = re.compile("(?=(" + "|".join(STYLE_KEYWORDS) + "))")
+
 
 class StoryToScenesTask(BaseTask):
     """
@@ -142,7 +149,7 @@ class StoryToScenesValidator(BaseValidator):
         if config_path and config_path.exists():
             try:
                 with open(config_path, "r") as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=YamlSafeLoader)
                     if "styles" in config and "captions" in config["styles"]:
                         self.valid_styles = set(config["styles"]["captions"].keys())
             except Exception:
@@ -166,7 +173,7 @@ class StoryToScenesValidator(BaseValidator):
 
         try:
             # Try to parse as YAML
-            scenes_data = yaml.safe_load(output)
+            scenes_data = yaml.load(output, Loader=YamlSafeLoader)
         except yaml.YAMLError as e:
             result.add_error(f"Invalid YAML syntax: {str(e)}")
             return result
@@ -192,6 +199,23 @@ class StoryToScenesValidator(BaseValidator):
 
         return result
 
+    def check_partial(self, partial_output: str, context: Optional[Dict[str, Any]] = None) -> Optional[ValidationResult]:
+        """
+        Reject output wrapped in a markdown code block as soon as it starts.
+
+        A backtick can't start a YAML document, so such output never validates.
+
+        Args:
+            partial_output: Scene YAML received so far
+            context: Optional context (unused)
+
+        Returns:
+            A failed ValidationResult for fenced output, otherwise None
+        """
+        if partial_output.lstrip().startswith("`"):
+            return ValidationResult(is_valid=False, errors=["Output is wrapped in a markdown code block - return the raw YAML list without backticks"])
+        return None
+
     def _validate_scene(self, scene: Dict[str, Any], scene_num: int, result: ValidationResult) -> None:
         """Validate a single scene dictionary."""
 
@@ -247,10 +271,10 @@ class StoryToScenesValidator(BaseValidator):
 
         # Check that style info is NOT embedded in prompt
         if "prompt" in image_data and isinstance(image_data["prompt"], str):
-            prompt_lower = image_data["prompt"].lower()
-            style_keywords = ["photorealistic", "cinematic", "artistic", "style"]
-            for keyword in style_keywords:
-                if keyword in prompt_lower:
+            # One scan for all keywords; substring matches, so "styled" still counts as "style"
+            found = set(_STYLE_KEYWORD_RE.findall(image_data["prompt"].lower()))
+            for keyword in STYLE_KEYWORDS:
+                if keyword in found:
                     result.add_error(f"Scene {scene_num}: image prompt contains style keyword '{keyword}' - use separate 'style' field instead")
 
     def _validate_audio_section(self, audio_data: Any, scene_num: int, result: ValidationResult) -> None:
@@ -7,11 +7,13 @@ especially useful for expensive validations like JSON schema or complex regex pa
 
 import gc
 import hashlib
+import json
 import time
 import weakref
-from dataclasses import dataclass, field
-from threading import RLock
-from typing import Any, Dict, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
 
 from .base_validator import ValidationResult
 
@@ -20,30 +22,35 @@ from .base_validator import ValidationResult
 class CacheEntry:
     """Single cache entry with validation result and metadata."""
 
+    # A cache can hold many thousands of entries, so skip the per-instance __dict__; slots
+    # rule out field defaults here, so every field is passed explicitly
+    __slots__ = ("result", "timestamp", "expires_at", "access_count", "last_access", "size_bytes")
+
     result: ValidationResult
-    timestamp: float
-    access_count: int = 0
-    last_access: float = field(default_factory=time.time)
-    size_bytes: int = 0
+    timestamp: float  # time.monotonic() when stored
+    expires_at: float  # time.monotonic() deadline after which the entry is stale
+    access_count: int
+    last_access: float
+    size_bytes: int
 
-    def mark_accessed(self) -> None:
+    def mark_accessed(self, now: Optional[float] = None) -> None:
         """Mark this entry as recently accessed."""
         self.access_count += 1
-        self.last_access = time.time()
+        self.last_access = time.monotonic() if now is None else now
 
-    def is_expired(self, ttl_seconds: float) -> bool:
-        """Check if entry is expired based on TTL."""
-        return time.time() - self.timestamp > ttl_seconds
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if entry is past its deadline."""
+        return (time.monotonic() if now is None else now) > self.expires_at
 
     def age_seconds(self) -> float:
         """Get age of entry in seconds."""
-        return time.time() - self.timestamp
+        return time.monotonic() - self.timestamp
 
 
 class ValidationCache:
     """High-performance cache for validation results with intelligent eviction."""
 
-    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600.0, max_memory_mb: float = 100.0, cleanup_interval: int = 100):  # 1 hour default
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600.0, max_memory_mb: float = 100.0, cleanup_interval: int = 100, weak_fallback: bool = False):  # 1 hour default
         """Initialize validation cache.
 
         Args:
@@ -51,16 +58,26 @@ class ValidationCache:
             ttl_seconds: Time-to-live for entries in seconds
             max_memory_mb: Maximum memory usage in MB
             cleanup_interval: Cleanup every N operations
+            weak_fallback: Keep weak references to evicted results, so ones still referenced elsewhere
+                are served again until they expire instead of being recomputed
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
         self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
         self.cleanup_interval = cleanup_interval
-
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = RLock()
+        self.weak_fallback = weak_fallback
+
+        # Entries are kept in least- to most-recently-used order, with their total size tracked as they come and go
+        self._cache: "OrderedDict[bytes, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        # Evicted results, held only as long as something outside the cache holds them, with the
+        # (timestamp, expires_at, size_bytes) needed to restore their entries
+        self._weak: "weakref.WeakValueDictionary[bytes, ValidationResult]" = weakref.WeakValueDictionary()
+        self._evicted: Dict[bytes, Tuple[float, float, int]] = {}
+        # Held only around dict and counter updates; key hashing and size estimates happen before taking it
+        self._lock = Lock()
         self._operation_count = 0
-        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "cleanups": 0, "memory_pressure_evictions": 0}
+        self._stats = {"hits": 0, "misses": 0, "weak_hits": 0, "evictions": 0, "cleanups": 0, "memory_pressure_evictions": 0}
 
         # Weak reference to enable cleanup when cache is deleted
         self._self_ref = weakref.ref(self, self._cleanup_callback)
@@ -70,17 +87,19 @@ class ValidationCache:
         """Callback for cleanup when cache is deleted."""
         pass
 
-    def _generate_cache_key(self, validator_id: str, input_data: str, context: Optional[Dict[str, Any]] = None) -> str:
+    def _generate_cache_key(self, validator_id: str, input_data: str, context: Optional[Dict[str, Any]] = None) -> bytes:
         """Generate a deterministic cache key for validation inputs."""
-        # Include validator configuration and context in key
-        key_data = {"validator": validator_id, "input": input_data, "context": context or {}}
-
-        # Create hash of the key data
-        key_string = f"{validator_id}:{input_data}"
+        # Feed the parts to the digest separately rather than building one concatenated copy of the input
+        digest = hashlib.sha256(validator_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(input_data.encode("utf-8"))
         if context:
-            key_string += f":{hash(frozenset(context.items()))}"
+            # Canonical JSON so equal contexts give equal keys, including ones holding lists or dicts
+            digest.update(b"\0")
+            digest.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
 
-        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()[:32]
+        # The raw 128-bit prefix is as collision-safe as its hex form at half the size
+        return digest.digest()[:16]
 
     def _estimate_size(self, result: ValidationResult) -> int:
         """Estimate memory size of validation result in bytes."""
@@ -108,35 +127,70 @@ class ValidationCache:
 
     def _get_memory_usage(self) -> int:
         """Estimate current memory usage of cache."""
-        return sum(entry.size_bytes for entry in self._cache.values())
+        return self._memory_bytes
+
+    def _remove(self, key: bytes) -> None:
+        """Remove an entry and its size from the running total."""
+        self._memory_bytes -= self._cache.pop(key).size_bytes
+
+    def _demote(self, key: bytes, entry: CacheEntry) -> None:
+        """Keep a weak reference to an evicted entry's result when the weak fallback is enabled."""
+        if self.weak_fallback:
+            self._weak[key] = entry.result
+            self._evicted[key] = (entry.timestamp, entry.expires_at, entry.size_bytes)
+
+    def _promote(self, key: bytes, now: float) -> Optional[CacheEntry]:
+        """Restore an evicted entry whose result is still alive and unexpired."""
+        evicted = self._evicted.pop(key, None)
+        result = self._weak.pop(key, None)
+        if evicted is None or result is None:
+            return None
+        timestamp, expires_at, size_bytes = evicted
+        if now > expires_at:
+            return None
+
+        entry = CacheEntry(result=result, timestamp=timestamp, expires_at=expires_at, access_count=0, last_access=now, size_bytes=size_bytes)
+        self._cache[key] = entry
+        self._memory_bytes += size_bytes
+        return entry
+
+    def _prune_evicted(self) -> None:
+        """Drop restore data for evicted results that have since been collected or expired."""
+        now = time.monotonic()
+        stale = [key for key, (_, expires_at, _) in self._evicted.items() if now > expires_at or key not in self._weak]
+        for key in stale:
+            del self._evicted[key]
+            self._weak.pop(key, None)
+
+    def _maybe_cleanup(self) -> None:
+        """Run eviction when an operation count or size limit calls for it."""
+        if self._should_cleanup():
+            evicted = self._smart_eviction()
+            self._stats["evictions"] += evicted
+            self._stats["cleanups"] += 1
 
     def _cleanup_expired(self) -> int:
         """Remove expired entries from cache."""
         expired_keys = []
-        current_time = time.time()
+        current_time = time.monotonic()
 
         for key, entry in self._cache.items():
-            if current_time - entry.timestamp > self.ttl_seconds:
+            if entry.is_expired(current_time):
                 expired_keys.append(key)
 
         for key in expired_keys:
-            del self._cache[key]
+            self._remove(key)
 
         return len(expired_keys)
 
     def _evict_lru_entries(self, target_count: int) -> int:
         """Evict least recently used entries."""
-        if len(self._cache) <= target_count:
-            return 0
-
-        # Sort by last access time (oldest first)
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].last_access)
-
         evicted = 0
-        for key, _ in sorted_entries:
-            if len(self._cache) <= target_count:
-                break
-            del self._cache[key]
+        while len(self._cache) > target_count:
+            # The front of the ordered dict is the least recently used entry
+            key, entry = self._cache.popitem(last=False)
+            self._memory_bytes -= entry.size_bytes
+            self._demote(key, entry)
             evicted += 1
 
         return evicted
@@ -159,6 +213,9 @@ class ValidationCache:
             evicted += memory_evicted
             self._stats["memory_pressure_evictions"] += memory_evicted
 
+        if self._evicted:
+            self._prune_evicted()
+
         return evicted
 
     def _evict_by_memory_efficiency(self) -> int:
@@ -179,57 +236,84 @@ class ValidationCache:
         for key, entry, efficiency in entries_with_efficiency:
             if self._get_memory_usage() <= target_memory:
                 break
-            del self._cache[key]
+            self._remove(key)
+            self._demote(key, entry)
             evicted += 1
 
         return evicted
 
     def get(self, validator_id: str, input_data: str, context: Optional[Dict[str, Any]] = None) -> Optional[ValidationResult]:
         """Retrieve cached validation result."""
+        cache_key = self._generate_cache_key(validator_id, input_data, context)
         with self._lock:
-            cache_key = self._generate_cache_key(validator_id, input_data, context)
-
-            if cache_key not in self._cache:
-                self._stats["misses"] += 1
-                return None
-
-            entry = self._cache[cache_key]
+            entry = self._cache.get(cache_key)
+            now = time.monotonic()
+            if entry is None:
+                # Fall back to a result evicted earlier but still held elsewhere
+                entry = self._promote(cache_key, now) if self._evicted else None
+                if entry is None:
+                    self._stats["misses"] += 1
+                    return None
+                entry.mark_accessed(now)
+                self._stats["hits"] += 1
+                self._stats["weak_hits"] += 1
+                # The restored entry may take the cache back over its limits
+                self._maybe_cleanup()
+                return entry.result
 
             # Check if expired
-            if entry.is_expired(self.ttl_seconds):
-                del self._cache[cache_key]
+            if entry.is_expired(now):
+                self._remove(cache_key)
                 self._stats["misses"] += 1
                 return None
 
             # Mark as accessed and update stats
-            entry.mark_accessed()
+            self._cache.move_to_end(cache_key)
+            entry.mark_accessed(now)
             self._stats["hits"] += 1
 
             return entry.result
 
-    def put(self, validator_id: str, input_data: str, result: ValidationResult, context: Optional[Dict[str, Any]] = None) -> None:
-        """Store validation result in cache."""
-        with self._lock:
-            cache_key = self._generate_cache_key(validator_id, input_data, context)
+    def put(self, validator_id: str, input_data: str, result: ValidationResult, context: Optional[Dict[str, Any]] = None, ttl_seconds: Optional[float] = None) -> None:
+        """Store validation result in cache.
 
-            # Estimate size of result
-            size_bytes = self._estimate_size(result)
+        Args:
+            validator_id: Identifier of the validator that produced the result
+            input_data: The validated input
+            result: Validation result to cache
+            context: Context that affected validation, if any
+            ttl_seconds: Time-to-live for this entry (defaults to the cache's ttl_seconds)
+        """
+        cache_key = self._generate_cache_key(validator_id, input_data, context)
 
-            # Create cache entry
-            entry = CacheEntry(result=result, timestamp=time.time(), size_bytes=size_bytes)
+        # Estimate size of result
+        size_bytes = self._estimate_size(result)
 
+        # Create cache entry
+        now = time.monotonic()
+        entry = CacheEntry(result=result, timestamp=now, expires_at=now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds), access_count=0, last_access=now, size_bytes=size_bytes)
+
+        with self._lock:
+            # Replace any previous entry as the most recently used
+            if cache_key in self._cache:
+                self._remove(cache_key)
+            elif self._evicted:
+                # A fresh result supersedes any evicted one for the same key
+                self._evicted.pop(cache_key, None)
+                self._weak.pop(cache_key, None)
             self._cache[cache_key] = entry
+            self._memory_bytes += size_bytes
 
             # Perform cleanup if needed
-            if self._should_cleanup():
-                evicted = self._smart_eviction()
-                self._stats["evictions"] += evicted
-                self._stats["cleanups"] += 1
+            self._maybe_cleanup()
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._memory_bytes = 0
+            self._weak.clear()
+            self._evicted.clear()
             self._stats = {key: 0 for key in self._stats}
 
     def get_stats(self) -> Dict[str, Any]:
@@ -246,6 +330,7 @@ class ValidationCache:
                 "hit_rate": hit_rate,
                 "hits": self._stats["hits"],
                 "misses": self._stats["misses"],
+                "weak_hits": self._stats["weak_hits"],
                 "evictions": self._stats["evictions"],
                 "cleanups": self._stats["cleanups"],
                 "memory_pressure_evictions": self._stats["memory_pressure_evictions"],
@@ -282,14 +367,14 @@ def get_global_cache() -> ValidationCache:
     """Get or create the global validation cache instance."""
     global _global_cache
     if _global_cache is None:
-        _global_cache = ValidationCache()
+        _global_cache = ValidationCache(weak_fallback=True)
     return _global_cache
 
 
-def configure_global_cache(max_size: int = 10000, ttl_seconds: float = 3600.0, max_memory_mb: float = 100.0, cleanup_interval: int = 100) -> ValidationCache:
+def configure_global_cache(max_size: int = 10000, ttl_seconds: float = 3600.0, max_memory_mb: float = 100.0, cleanup_interval: int = 100, weak_fallback: bool = True) -> ValidationCache:
     """Configure the global validation cache with custom settings."""
     global _global_cache
-    _global_cache = ValidationCache(max_size=max_size, ttl_seconds=ttl_seconds, max_memory_mb=max_memory_mb, cleanup_interval=cleanup_interval)
+    _global_cache = ValidationCache(max_size=max_size, ttl_seconds=ttl_seconds, max_memory_mb=max_memory_mb, cleanup_interval=cleanup_interval, weak_fallback=weak_fallback)
     return _global_cache
 
 
@@ -8,7 +8,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .base_validator import BaseValidator, FunctionValidator, ValidationResult
 from .config import ValidatedLLMConfig, get_config
@@ -116,6 +116,7 @@ class ValidationLoop:
         max_retries: Optional[int] = None,
         context: Optional[Dict[str, Any]] = None,
         debug: bool = False,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """
         Execute the LLM validation loop.
@@ -126,6 +127,7 @@ class ValidationLoop:
             max_retries: Maximum retry attempts (uses default if None)
             context: Additional context for validation
             debug: Enable debug logging and output preservation
+            stream: Stream each response through the validator's check_partial and stop generating as soon as it fails
         Returns:
             Dictionary with execution results:
             {
@@ -146,18 +148,40 @@ class ValidationLoop:
         elif callable(validator) and not isinstance(validator, BaseValidator):
             validator = FunctionValidator(validator)
         logger.info(f"Starting LLM validation loop with validator: {validator.name}")
+        # Render the task prompt once; a template that can't be filled would fail every attempt without reaching the LLM
+        try:
+            task_prompt = prompt_template.format(**input_data)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Failed to render prompt template: {str(e)}")
+            result = {
+                "success": False,
+                "output": "",
+                "attempts": 1,
+                "validation_result": None,
+                "execution_time": time.time() - start_time,
+            }
+            if debug and debug_info is not None:
+                debug_info.append(
+                    {
+                        "attempt": 1,
+                        "error": str(e),
+                        "timestamp": time.time(),
+                    }
+                )
+                result["debug_info"] = debug_info
+            return result
         # Build comprehensive system prompt for LLM provider
         system_prompt = self._build_system_prompt(prompt_template, validator, input_data)
         # Initialize validation_result for proper scoping
         validation_result: Optional[ValidationResult] = None
+        partial_result: Optional[ValidationResult] = None
         cleaned_output = ""
         for attempt in range(max_retries):
             logger.info(f"Attempt {attempt + 1}/{max_retries}")
             try:
                 # For first attempt, ask for the initial task
                 if attempt == 0:
-                    task_prompt = prompt_template.format(**input_data)
-                    llm_response = self.llm_provider.generate(system_prompt, task_prompt)
+                    llm_response, partial_result = self._generate(system_prompt, task_prompt, validator, context, stream)
                 else:
                     # For subsequent attempts, provide feedback
                     if validation_result is not None:
@@ -167,7 +191,7 @@ class ValidationLoop:
 Please provide a corrected response that addresses these issues."""
                     else:
                         retry_prompt = "Please provide a corrected response."
-                    llm_response = self.llm_provider.generate(system_prompt, retry_prompt)
+                    llm_response, partial_result = self._generate(system_prompt, retry_prompt, validator, context, stream)
                 if debug and debug_info is not None:
                     debug_info.append(
                         {
@@ -179,8 +203,8 @@ Please provide a corrected response that addresses these issues."""
                     )
                 # Extract and clean the output
                 cleaned_output = self._extract_output(llm_response)
-                # Validate the output
-                validation_result = validator.validate(cleaned_output, context)
+                # Validate the output, unless streaming already found it can't pass
+                validation_result = partial_result or validator.validate(cleaned_output, context)
                 if validation_result.is_valid:
                     execution_time = time.time() - start_time
                     logger.info(f"Validation successful after {attempt + 1} attempt(s)")
@@ -220,6 +244,31 @@ Please provide a corrected response that addresses these issues."""
             result["debug_info"] = debug_info
         return result
 
+    def _generate(self, system_prompt: str, user_message: str, validator: BaseValidator, context: Optional[Dict[str, Any]], stream: bool) -> Tuple[str, Optional[ValidationResult]]:
+        """
+        Get one response from the LLM provider.
+
+        When streaming, the output so far is checked after every chunk and the stream is
+        closed at the first failure, so the rest of a doomed response is never generated.
+
+        Returns:
+            The (possibly partial) response and the failed partial check, if generation stopped early
+        """
+        if not stream:
+            return self.llm_provider.generate(system_prompt, user_message), None
+        output = ""
+        chunks = self.llm_provider.generate_stream(system_prompt, user_message)
+        try:
+            for chunk in chunks:
+                output += chunk
+                partial_result = validator.check_partial(output, context)
+                if partial_result is not None and not partial_result.is_valid:
+                    logger.info(f"Stopped generation early after {len(output)} characters")
+                    return output, partial_result
+        finally:
+            chunks.close()
+        return output, None
+
     def _build_system_prompt(self, prompt_template: str, validator: BaseValidator, input_data: Dict[str, Any]) -> str:
         """Build comprehensive system prompt for LLM provider."""
         # Get validation instructions
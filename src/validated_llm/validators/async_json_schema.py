@@ -7,10 +7,11 @@ import json
 from typing import Any, Dict, List, Optional
 
 import jsonschema
-from jsonschema import Draft7Validator, ValidationError
+from jsonschema import ValidationError
 
 from ..async_validator import AsyncBaseValidator
 from ..base_validator import ValidationResult
+from .json_schema import get_draft7_validator
 
 
 class AsyncJSONSchemaValidator(AsyncBaseValidator):
@@ -51,10 +52,7 @@ class AsyncJSONSchemaValidator(AsyncBaseValidator):
         self.strict_mode = strict_mode
 
         # Create validator with optional format checking
-        if format_checker:
-            self.validator = Draft7Validator(schema, format_checker=Draft7Validator.FORMAT_CHECKER)
-        else:
-            self.validator = Draft7Validator(schema)
+        self.validator = get_draft7_validator(schema, format_checker)
 
     async def validate_async(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """Validate JSON output against the schema asynchronously.
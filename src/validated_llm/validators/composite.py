@@ -1,7 +1,7 @@
 """Composite validator for combining multiple validators with logical operations."""
 
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 from ..base_validator import BaseValidator, ValidationResult
 
@@ -27,6 +27,7 @@ class CompositeValidator(BaseValidator):
         operator: Union[LogicOperator, str] = LogicOperator.AND,
         short_circuit: bool = True,
         aggregate_metadata: bool = True,
+        reorder: bool = False,
     ):
         """
         Initialize composite validator.
@@ -36,6 +37,8 @@ class CompositeValidator(BaseValidator):
             operator: Logic operator (AND/OR)
             short_circuit: Stop evaluation on first failure (AND) or success (OR)
             aggregate_metadata: Combine metadata from all validators
+            reorder: With short_circuit, run validators in ascending cost_hint order (ties keep their order),
+                so cheap checks get the chance to decide the result first
         """
         if not validators:
             raise ValueError("At least one validator must be provided")
@@ -44,6 +47,7 @@ class CompositeValidator(BaseValidator):
         self.operator = LogicOperator(operator) if isinstance(operator, str) else operator
         self.short_circuit = short_circuit
         self.aggregate_metadata = aggregate_metadata
+        self.reorder = reorder
 
     def validate(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """
@@ -56,65 +60,127 @@ class CompositeValidator(BaseValidator):
         Returns:
             ValidationResult with combined results
         """
-        results = []
-        all_errors = []
-        all_warnings = []
+        all_errors: List[str] = []
+        all_warnings: List[str] = []
         all_metadata: Dict[str, Any] = {}
+        # Count outcomes as we go rather than keeping every result for a second pass
+        results_count = 0
+        passed_count = 0
 
-        for i, validator in enumerate(self.validators):
+        for i, validator in self._ordered_validators():
             try:
                 result = validator.validate(output, context)
-                results.append(result)
-
-                # Aggregate errors and warnings
-                if result.errors:
-                    all_errors.extend([f"Validator {i+1}: {error}" for error in result.errors])
-                if result.warnings:
-                    all_warnings.extend([f"Validator {i+1}: {warning}" for warning in result.warnings])
-
-                # Aggregate metadata
-                if self.aggregate_metadata and result.metadata:
-                    all_metadata[f"validator_{i+1}"] = result.metadata
-
-                # Short-circuit logic
-                if self.short_circuit:
-                    if self.operator == LogicOperator.AND and not result.is_valid:
-                        # First failure in AND - stop processing
-                        break
-                    elif self.operator == LogicOperator.OR and result.is_valid:
-                        # First success in OR - stop processing
-                        break
-
             except Exception as e:
-                error_msg = f"Validator {i+1} failed with exception: {str(e)}"
-                all_errors.append(error_msg)
+                all_errors.append(f"Validator {i+1} failed with exception: {str(e)}")
 
                 # For AND operations, any exception is a failure
                 if self.operator == LogicOperator.AND and self.short_circuit:
                     break
+                continue
+
+            results_count += 1
+            if result.is_valid:
+                passed_count += 1
+            self._collect(i, result, all_errors, all_warnings, all_metadata)
+
+            if self._decides(result):
+                break
+
+        return self._combine(all_errors, all_warnings, all_metadata, results_count, passed_count)
+
+    def validate_batch(self, outputs: List[str], context: Optional[Dict[str, Any]] = None) -> List[ValidationResult]:
+        """
+        Validate several outputs, running each validator over all of them before moving to the next.
 
+        Each output gets the same result validate() would give it. With short_circuit, outputs whose
+        result is already decided are not passed to the remaining validators.
+
+        Args:
+            outputs: Contents to validate
+            context: Optional context for validation, shared by all outputs
+
+        Returns:
+            One ValidationResult per output, in the same order
+        """
+        all_errors: List[List[str]] = [[] for _ in outputs]
+        all_warnings: List[List[str]] = [[] for _ in outputs]
+        all_metadata: List[Dict[str, Any]] = [{} for _ in outputs]
+        results_counts = [0] * len(outputs)
+        passed_counts = [0] * len(outputs)
+        # Indexes of outputs still waiting on the remaining validators
+        pending = list(range(len(outputs)))
+
+        for i, validator in self._ordered_validators():
+            if not pending:
+                break
+
+            still_pending = []
+            for j in pending:
+                try:
+                    result = validator.validate(outputs[j], context)
+                except Exception as e:
+                    all_errors[j].append(f"Validator {i+1} failed with exception: {str(e)}")
+                    if not (self.operator == LogicOperator.AND and self.short_circuit):
+                        still_pending.append(j)
+                    continue
+
+                results_counts[j] += 1
+                if result.is_valid:
+                    passed_counts[j] += 1
+                self._collect(i, result, all_errors[j], all_warnings[j], all_metadata[j])
+
+                if not self._decides(result):
+                    still_pending.append(j)
+            pending = still_pending
+
+        return [self._combine(all_errors[j], all_warnings[j], all_metadata[j], results_counts[j], passed_counts[j]) for j in range(len(outputs))]
+
+    def _ordered_validators(self) -> Iterable[Tuple[int, BaseValidator]]:
+        """Pair validators with their original positions, in the order they should run."""
+        # Errors and metadata keep each validator's original position, whatever order they run in
+        ordered: Iterable[Tuple[int, BaseValidator]] = enumerate(self.validators)
+        if self.reorder and self.short_circuit:
+            ordered = sorted(ordered, key=lambda item: getattr(item[1], "cost_hint", 1.0))
+        return ordered
+
+    def _decides(self, result: ValidationResult) -> bool:
+        """Check whether a result settles the composite: a failure for AND, a success for OR."""
+        return self.short_circuit and result.is_valid == (self.operator == LogicOperator.OR)
+
+    def _collect(self, index: int, result: ValidationResult, errors: List[str], warnings: List[str], metadata: Dict[str, Any]) -> None:
+        """Add one validator's errors, warnings and metadata to the running totals."""
+        if result.errors:
+            errors.extend(f"Validator {index+1}: {error}" for error in result.errors)
+        if result.warnings:
+            warnings.extend(f"Validator {index+1}: {warning}" for warning in result.warnings)
+
+        if self.aggregate_metadata and result.metadata:
+            metadata[f"validator_{index+1}"] = result.metadata
+
+    def _combine(self, errors: List[str], warnings: List[str], metadata: Dict[str, Any], results_count: int, passed_count: int) -> ValidationResult:
+        """Build the overall result from the collected totals."""
         # Determine overall validity based on operator
         if self.operator == LogicOperator.AND:
             # AND: All validators must pass
-            is_valid = all(result.is_valid for result in results) and len(results) == len(self.validators)
+            is_valid = passed_count == len(self.validators)
         else:
             # OR: At least one validator must pass
-            is_valid = any(result.is_valid for result in results)
+            is_valid = passed_count > 0
 
         # Add operation metadata
         operation_metadata = {
             "operator": self.operator.value,
             "validator_count": len(self.validators),
-            "results_count": len(results),
+            "results_count": results_count,
             "short_circuit": self.short_circuit,
         }
 
         if self.aggregate_metadata:
-            all_metadata["operation"] = operation_metadata
+            metadata["operation"] = operation_metadata
         else:
-            all_metadata = operation_metadata
+            metadata = operation_metadata
 
-        return ValidationResult(is_valid=is_valid, errors=all_errors, warnings=all_warnings, metadata=all_metadata)
+        return ValidationResult(is_valid=is_valid, errors=errors, warnings=warnings, metadata=metadata)
 
     def get_description(self) -> str:
         """Get description of the composite validator."""
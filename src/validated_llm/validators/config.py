@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Set
 import yaml
 
 from ..base_validator import BaseValidator, ValidationResult
+from ..config import YamlSafeLoader
 
 
 class ConfigValidator(BaseValidator):
@@ -78,7 +79,7 @@ class ConfigValidator(BaseValidator):
 
         # Parse YAML
         try:
-            config_data = yaml.safe_load(output)
+            config_data = yaml.load(output, Loader=YamlSafeLoader)
         except yaml.YAMLError as e:
             return ValidationResult(is_valid=False, errors=[f"Invalid YAML syntax: {str(e)}"], warnings=[], metadata={})
 
@@ -3,6 +3,7 @@ JSON Schema validator for validating JSON data against a schema.
 """
 
 import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 import jsonschema
@@ -11,6 +12,40 @@ from jsonschema import Draft7Validator, ValidationError
 from validated_llm.base_validator import BaseValidator, ValidationResult
 
 
+@lru_cache(maxsize=128)
+def _compile_schema(schema_json: str, format_checker: bool) -> Draft7Validator:
+    """Build a Draft 7 validator for a canonical JSON encoding of a schema.
+
+    Validators are stateless between calls, so one instance is shared by
+    every JSON schema validator using an equal schema.
+    """
+    return _new_draft7_validator(json.loads(schema_json), format_checker)
+
+
+def _new_draft7_validator(schema: Dict[str, Any], format_checker: bool) -> Draft7Validator:
+    """Build a Draft 7 validator, with format checking if requested."""
+    if format_checker:
+        return Draft7Validator(schema, format_checker=Draft7Validator.FORMAT_CHECKER)
+    return Draft7Validator(schema)
+
+
+def get_draft7_validator(schema: Dict[str, Any], format_checker: bool = True) -> Draft7Validator:
+    """Get a Draft 7 validator for a schema, reusing the one built for any equal schema.
+
+    Args:
+        schema: The JSON Schema to validate against
+        format_checker: If True, enable format checking (email, uri, etc.)
+
+    Returns:
+        Draft7Validator for the schema
+    """
+    try:
+        return _compile_schema(json.dumps(schema, sort_keys=True), format_checker)
+    except TypeError:
+        # Schema holds values that can't be serialized as a cache key
+        return _new_draft7_validator(schema, format_checker)
+
+
 class JSONSchemaValidator(BaseValidator):
     """Validator that uses JSON Schema to validate JSON data.
 
@@ -46,10 +81,7 @@ class JSONSchemaValidator(BaseValidator):
         self.strict_mode = strict_mode
 
         # Create validator with optional format checking
-        if format_checker:
-            self.validator = Draft7Validator(schema, format_checker=Draft7Validator.FORMAT_CHECKER)
-        else:
-            self.validator = Draft7Validator(schema)
+        self.validator = get_draft7_validator(schema, format_checker)
 
     def validate(self, output: str, context: Optional[dict[str, Any]] = None) -> ValidationResult:
         """Validate JSON output against the schema.
@@ -37,6 +37,9 @@ class StyleValidator(BaseValidator):
         ```
     """
 
+    # Each validation runs an external formatter process
+    cost_hint = 10.0
+
     FORMATTERS: Dict[str, Dict[str, Dict[str, Any]]] = {
         "python": {
             "black": {"command": ["black", "-"], "check_command": ["black", "--check", "-"]},
@@ -0,0 +1,24 @@
+"""
+Shared pytest options and fixtures for the test suite.
+"""
+
+from pathlib import Path
+
+import pytest
+
+# Hand-written known-good response to the integration test's "cat on a mat" story. Unit tests depend on
+# its exact text, so it is kept apart from llm_responses/, which --record-llm overwrites
+STORY_SCENES_YAML = Path(__file__).parent / "fixtures" / "story_scenes.yaml"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Choose how integration tests talk to the LLM; by default they replay recorded responses."""
+    group = parser.getgroup("validated-llm")
+    group.addoption("--live-llm", action="store_true", default=False, help="Run integration tests against a live LLM instead of recorded responses")
+    group.addoption("--record-llm", action="store_true", default=False, help="Run integration tests against a live LLM and save its responses for replay")
+
+
+@pytest.fixture(scope="session")
+def story_scenes_output() -> str:
+    """A valid story-to-scenes YAML response with three scenes."""
+    return STORY_SCENES_YAML.read_text(encoding="utf-8")
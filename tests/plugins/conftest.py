@@ -0,0 +1,55 @@
+"""
+Shared fixtures for plugin system tests.
+"""
+
+from typing import Any, Dict, Optional, Type
+
+import pytest
+
+from validated_llm.base_validator import BaseValidator, ValidationResult
+from validated_llm.plugins.manager import PluginManager
+from validated_llm.plugins.registry import PluginRegistry
+
+
+class DummyValidator(BaseValidator):
+    """Test validator for plugin manager tests."""
+
+    def __init__(self, validator_name: str = "test_validator"):
+        super().__init__(validator_name, "Test validator for manager tests")
+
+    def validate(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
+        return ValidationResult(is_valid=len(output) > 0, errors=[] if output else ["Empty output"])
+
+
+@pytest.fixture(scope="session")
+def dummy_validator_cls() -> Type[BaseValidator]:
+    """Validator class shared by plugin tests that register a plugin."""
+    return DummyValidator
+
+
+@pytest.fixture(scope="session")
+def session_registry() -> PluginRegistry:
+    """Plugin registry shared across the session, isolated from the global one."""
+    return PluginRegistry()
+
+
+@pytest.fixture(scope="session")
+def session_manager(session_registry: PluginRegistry) -> PluginManager:
+    """Plugin manager shared across the session, backed by the session registry."""
+    return PluginManager(session_registry)
+
+
+@pytest.fixture
+def registry(session_registry: PluginRegistry) -> PluginRegistry:
+    """Empty plugin registry, cleared before each test."""
+    session_registry.clear()
+    return session_registry
+
+
+@pytest.fixture
+def manager(session_manager: PluginManager, registry: PluginRegistry) -> PluginManager:
+    """Uninitialized plugin manager with an empty registry and no search paths."""
+    session_manager._initialized = False
+    session_manager.discovery._search_paths.clear()
+    session_manager.discovery._namespace_packages.clear()
+    return session_manager
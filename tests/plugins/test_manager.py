@@ -2,26 +2,38 @@
 Tests for the plugin manager.
 """
 
-import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Type
 
 import pytest
 
-from validated_llm.base_validator import BaseValidator, ValidationResult
+from validated_llm.base_validator import BaseValidator
 from validated_llm.plugins.exceptions import PluginError
 from validated_llm.plugins.manager import PluginManager
-from validated_llm.plugins.registry import PluginRegistry, ValidationPlugin
-
+from validated_llm.plugins.registry import PluginRegistry
 
-class DummyValidator(BaseValidator):
-    """Test validator for plugin manager tests."""
+# Source of a minimal plugin module used by the discovery tests
+_PLUGIN_SOURCE = """
+from validated_llm.base_validator import BaseValidator, ValidationResult
+from typing import Any, Dict, Optional
 
-    def __init__(self, validator_name: str = "test_validator"):
-        super().__init__(validator_name, "Test validator for manager tests")
+class TestDiscoveryValidator(BaseValidator):
+    def __init__(self):
+        super().__init__("discovery_test", "Test discovery validator")
 
     def validate(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
-        return ValidationResult(is_valid=len(output) > 0, errors=[] if output else ["Empty output"])
+        return ValidationResult(is_valid=True, errors=[])
+
+PLUGIN_INFO = {
+    "name": "discovery_test",
+    "version": "1.0.0",
+    "description": "Test plugin for discovery",
+    "author": "Test Suite",
+    "validator_class": TestDiscoveryValidator,
+    "dependencies": [],
+    "tags": ["test", "discovery"],
+}
+"""
 
 
 class TestPluginManager:
@@ -42,14 +54,12 @@ class TestPluginManager:
         manager.initialize()
         assert manager._initialized
 
-    def test_register_plugin_direct(self) -> None:
+    def test_register_plugin_direct(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test registering a plugin directly with the manager."""
-        manager = PluginManager(PluginRegistry())
-
-        plugin = manager.register_plugin(validator_class=DummyValidator, name="direct_test", version="1.0.0", description="Directly registered test plugin", author="Test Suite", tags=["test", "direct"])
+        plugin = manager.register_plugin(validator_class=dummy_validator_cls, name="direct_test", version="1.0.0", description="Directly registered test plugin", author="Test Suite", tags=["test", "direct"])
 
         assert plugin.name == "direct_test"
-        assert plugin.validator_class == DummyValidator
+        assert plugin.validator_class == dummy_validator_cls
         assert "test" in plugin.tags
 
         # Verify it's accessible through manager
@@ -57,45 +67,37 @@ class TestPluginManager:
         assert retrieved is not None
         assert retrieved.name == "direct_test"
 
-    def test_create_validator_with_initialization(self) -> None:
+    def test_create_validator_with_initialization(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test creating validator automatically initializes manager."""
-        manager = PluginManager(PluginRegistry())
-
         # Register a plugin
-        manager.register_plugin(validator_class=DummyValidator, name="auto_init_test", version="1.0.0", description="Auto-initialization test", author="Test Suite")
+        manager.register_plugin(validator_class=dummy_validator_cls, name="auto_init_test", version="1.0.0", description="Auto-initialization test", author="Test Suite")
 
         # Creating validator should auto-initialize
         assert not manager._initialized
         validator = manager.create_validator("auto_init_test")
         assert manager._initialized
 
-        assert isinstance(validator, DummyValidator)
+        assert isinstance(validator, dummy_validator_cls)
 
-    def test_create_validator_with_args(self) -> None:
+    def test_create_validator_with_args(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test creating validator with constructor arguments."""
-        manager = PluginManager(PluginRegistry())
-
-        manager.register_plugin(validator_class=DummyValidator, name="args_test", version="1.0.0", description="Arguments test", author="Test Suite")
+        manager.register_plugin(validator_class=dummy_validator_cls, name="args_test", version="1.0.0", description="Arguments test", author="Test Suite")
 
         validator = manager.create_validator("args_test", validator_name="custom_name")
-        assert isinstance(validator, DummyValidator)
+        assert isinstance(validator, dummy_validator_cls)
         assert validator.name == "custom_name"
 
-    def test_create_validator_not_found(self) -> None:
+    def test_create_validator_not_found(self, manager: PluginManager) -> None:
         """Test creating validator fails when plugin not found."""
-        manager = PluginManager(PluginRegistry())
-
         with pytest.raises(PluginError, match="not found"):
             manager.create_validator("nonexistent_plugin")
 
-    def test_list_plugins(self) -> None:
+    def test_list_plugins(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test listing plugins through manager."""
-        manager = PluginManager(PluginRegistry())
-
         # Register multiple plugins
-        manager.register_plugin(validator_class=DummyValidator, name="list_test1", version="1.0.0", description="First list test", author="Test Suite", tags=["list", "test"])
+        manager.register_plugin(validator_class=dummy_validator_cls, name="list_test1", version="1.0.0", description="First list test", author="Test Suite", tags=["list", "test"])
 
-        manager.register_plugin(validator_class=DummyValidator, name="list_test2", version="1.0.0", description="Second list test", author="Test Suite", tags=["list", "example"])
+        manager.register_plugin(validator_class=dummy_validator_cls, name="list_test2", version="1.0.0", description="Second list test", author="Test Suite", tags=["list", "example"])
 
         # List all plugins
         all_plugins = manager.list_plugins()
@@ -106,11 +108,9 @@ class TestPluginManager:
         assert len(test_plugins) == 1
         assert test_plugins[0].name == "list_test1"
 
-    def test_get_plugin_info(self) -> None:
+    def test_get_plugin_info(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test getting plugin info through manager."""
-        manager = PluginManager(PluginRegistry())
-
-        manager.register_plugin(validator_class=DummyValidator, name="info_test", version="2.1.0", description="Info test plugin", author="Test Suite", dependencies=["pytest"], tags=["info", "test"])
+        manager.register_plugin(validator_class=dummy_validator_cls, name="info_test", version="2.1.0", description="Info test plugin", author="Test Suite", dependencies=["pytest"], tags=["info", "test"])
 
         info = manager.get_plugin_info("info_test")
         assert info is not None
@@ -122,28 +122,21 @@ class TestPluginManager:
         info = manager.get_plugin_info("nonexistent")
         assert info is None
 
-    def test_add_search_path(self) -> None:
+    def test_add_search_path(self, manager: PluginManager, tmp_path: Path) -> None:
         """Test adding search paths."""
-        manager = PluginManager(PluginRegistry())
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            search_path = Path(tmpdir)
+        # Should start with no custom paths
+        initial_paths = len(manager.discovery._search_paths)
 
-            # Should start with no custom paths
-            initial_paths = len(manager.discovery._search_paths)
+        manager.add_search_path(tmp_path)
 
-            manager.add_search_path(search_path)
+        # Should have added the path
+        assert len(manager.discovery._search_paths) == initial_paths + 1
+        assert tmp_path in manager.discovery._search_paths
 
-            # Should have added the path
-            assert len(manager.discovery._search_paths) == initial_paths + 1
-            assert search_path in manager.discovery._search_paths
-
-    def test_reload_plugins(self) -> None:
+    def test_reload_plugins(self, manager: PluginManager, dummy_validator_cls: Type[BaseValidator]) -> None:
         """Test reloading plugins."""
-        manager = PluginManager(PluginRegistry())
-
         # Register initial plugin
-        manager.register_plugin(validator_class=DummyValidator, name="reload_test", version="1.0.0", description="Reload test", author="Test Suite")
+        manager.register_plugin(validator_class=dummy_validator_cls, name="reload_test", version="1.0.0", description="Reload test", author="Test Suite")
 
         assert len(manager.list_plugins()) == 1
 
@@ -154,44 +147,32 @@ class TestPluginManager:
         assert len(plugins) == 0
         assert len(manager.list_plugins()) == 0
 
-    def test_discover_from_directory(self) -> None:
+    def test_discover_from_directory(self, manager: PluginManager, tmp_path: Path) -> None:
         """Test discovering plugins from a directory."""
-        manager = PluginManager(PluginRegistry())
+        # Create a test plugin file
+        (tmp_path / "test_plugin.py").write_text(_PLUGIN_SOURCE)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            plugin_dir = Path(tmpdir)
+        # Discover plugins from directory
+        discovered = list(manager.discovery.discover_from_directory(tmp_path))
 
-            # Create a test plugin file
-            plugin_file = plugin_dir / "test_plugin.py"
-            plugin_content = """
-from validated_llm.base_validator import BaseValidator, ValidationResult
-from typing import Any, Dict, Optional
+        assert len(discovered) == 1
+        assert discovered[0].name == "discovery_test"
+        assert discovered[0].version == "1.0.0"
 
-class TestDiscoveryValidator(BaseValidator):
-    def __init__(self):
-        super().__init__("discovery_test", "Test discovery validator")
+    def test_discover_from_directory_packages(self, manager: PluginManager, tmp_path: Path) -> None:
+        """Test discovering package plugins while skipping non-plugin entries."""
+        package_dir = tmp_path / "package_plugin"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text(_PLUGIN_SOURCE.replace("discovery_test", "package_test"))
 
-    def validate(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
-        return ValidationResult(is_valid=True, errors=[])
-
-PLUGIN_INFO = {
-    "name": "discovery_test",
-    "version": "1.0.0",
-    "description": "Test plugin for discovery",
-    "author": "Test Suite",
-    "validator_class": TestDiscoveryValidator,
-    "dependencies": [],
-    "tags": ["test", "discovery"],
-}
-"""
-            plugin_file.write_text(plugin_content)
+        # Entries that must not be treated as plugins
+        (tmp_path / "__init__.py").write_text("")
+        (tmp_path / "notes.txt").write_text("not a plugin")
+        (tmp_path / "not_a_package").mkdir()
 
-            # Discover plugins from directory
-            discovered = list(manager.discovery.discover_from_directory(plugin_dir))
+        discovered = list(manager.discovery.discover_from_directory(tmp_path))
 
-            assert len(discovered) == 1
-            assert discovered[0].name == "discovery_test"
-            assert discovered[0].version == "1.0.0"
+        assert [plugin.name for plugin in discovered] == ["package_test"]
 
 
 if __name__ == "__main__":
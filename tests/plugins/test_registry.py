@@ -2,6 +2,7 @@
 Tests for the plugin registry system.
 """
 
+from dataclasses import FrozenInstanceError
 from typing import Any, Dict, Optional
 
 import pytest
@@ -42,10 +43,8 @@ class InvalidValidator:
 class TestPluginRegistry:
     """Test cases for PluginRegistry."""
 
-    def test_register_plugin_success(self) -> None:
+    def test_register_plugin_success(self, registry: PluginRegistry) -> None:
         """Test successful plugin registration."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin", version="1.0.0", description="Test plugin", author="Test Author", validator_class=MockValidator)
 
         registry.register_plugin(plugin)
@@ -56,10 +55,8 @@ class TestPluginRegistry:
         assert retrieved.name == "test_plugin"
         assert retrieved.version == "1.0.0"
 
-    def test_register_plugin_duplicate_name(self) -> None:
+    def test_register_plugin_duplicate_name(self, registry: PluginRegistry) -> None:
         """Test registration fails with duplicate names."""
-        registry = PluginRegistry()
-
         plugin1 = ValidationPlugin(name="duplicate", version="1.0.0", description="First plugin", author="Author 1", validator_class=MockValidator)
 
         plugin2 = ValidationPlugin(name="duplicate", version="2.0.0", description="Second plugin", author="Author 2", validator_class=MockValidator)
@@ -69,10 +66,8 @@ class TestPluginRegistry:
         with pytest.raises(PluginRegistrationError, match="already registered"):
             registry.register_plugin(plugin2)
 
-    def test_register_validator_class_direct(self) -> None:
+    def test_register_validator_class_direct(self, registry: PluginRegistry) -> None:
         """Test registering a validator class directly."""
-        registry = PluginRegistry()
-
         plugin = registry.register_validator_class(validator_class=MockValidator, name="direct_plugin", version="1.0.0", description="Directly registered plugin", author="Test Author", tags=["test", "mock"])
 
         assert plugin.name == "direct_plugin"
@@ -84,37 +79,29 @@ class TestPluginRegistry:
         assert retrieved is not None
         assert retrieved.name == "direct_plugin"
 
-    def test_plugin_validation_missing_name(self) -> None:
+    def test_plugin_validation_missing_name(self, registry: PluginRegistry) -> None:
         """Test plugin validation fails with missing name."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="", version="1.0.0", description="Test plugin", author="Test Author", validator_class=MockValidator)  # Empty name
 
         with pytest.raises(PluginValidationError, match="name is required"):
             registry.register_plugin(plugin)
 
-    def test_plugin_validation_missing_version(self) -> None:
+    def test_plugin_validation_missing_version(self, registry: PluginRegistry) -> None:
         """Test plugin validation fails with missing version."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin", version="", description="Test plugin", author="Test Author", validator_class=MockValidator)  # Empty version
 
         with pytest.raises(PluginValidationError, match="version is required"):
             registry.register_plugin(plugin)
 
-    def test_plugin_validation_invalid_validator_class(self) -> None:
+    def test_plugin_validation_invalid_validator_class(self, registry: PluginRegistry) -> None:
         """Test plugin validation fails with invalid validator class."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin", version="1.0.0", description="Test plugin", author="Test Author", validator_class=InvalidValidator)  # type: ignore
 
         with pytest.raises(PluginValidationError, match="inherit from BaseValidator"):
             registry.register_plugin(plugin)
 
-    def test_create_validator_success(self) -> None:
+    def test_create_validator_success(self, registry: PluginRegistry) -> None:
         """Test creating validator instance from plugin."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin", version="1.0.0", description="Test plugin", author="Test Author", validator_class=MockValidator)
 
         registry.register_plugin(plugin)
@@ -124,10 +111,8 @@ class TestPluginRegistry:
         assert isinstance(validator, MockValidator)
         assert validator.name == "mock"
 
-    def test_create_validator_with_args(self) -> None:
+    def test_create_validator_with_args(self, registry: PluginRegistry) -> None:
         """Test creating validator with constructor arguments."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin_args", version="1.0.0", description="Test plugin with args", author="Test Author", validator_class=MockValidatorWithArgs)
 
         registry.register_plugin(plugin)
@@ -139,19 +124,15 @@ class TestPluginRegistry:
         assert validator.required_arg == "test_value"
         assert validator.optional_arg == "custom_value"
 
-    def test_create_validator_not_found(self) -> None:
+    def test_create_validator_not_found(self, registry: PluginRegistry) -> None:
         """Test creating validator fails when plugin not found."""
-        registry = PluginRegistry()
-
         from validated_llm.plugins.exceptions import PluginError
 
         with pytest.raises(PluginError, match="not found"):
             registry.create_validator("nonexistent_plugin")
 
-    def test_list_plugins(self) -> None:
+    def test_list_plugins(self, registry: PluginRegistry) -> None:
         """Test listing plugins."""
-        registry = PluginRegistry()
-
         # Register multiple plugins
         plugin1 = ValidationPlugin(name="plugin1", version="1.0.0", description="First plugin", author="Author 1", validator_class=MockValidator, tags=["tag1", "common"])
 
@@ -172,10 +153,36 @@ class TestPluginRegistry:
         assert len(tag1_plugins) == 1
         assert tag1_plugins[0].name == "plugin1"
 
-    def test_unregister_plugin(self) -> None:
-        """Test unregistering plugins."""
-        registry = PluginRegistry()
+    def test_list_plugins_by_tag_after_unregister(self, registry: PluginRegistry) -> None:
+        """Test tag listing reflects unregistered and cleared plugins."""
+        plugin1 = ValidationPlugin(name="plugin1", version="1.0.0", description="First plugin", author="Author 1", validator_class=MockValidator, tags=["tag1", "common"])
+
+        plugin2 = ValidationPlugin(name="plugin2", version="1.0.0", description="Second plugin", author="Author 2", validator_class=MockValidator, tags=["common"])
 
+        registry.register_plugin(plugin1)
+        registry.register_plugin(plugin2)
+
+        registry.unregister_plugin("plugin1")
+        assert registry.list_plugins(tag="tag1") == []
+        assert [p.name for p in registry.list_plugins(tag="common")] == ["plugin2"]
+
+        registry.clear()
+        assert registry.list_plugins(tag="common") == []
+
+    def test_plugin_is_hashable_and_immutable(self) -> None:
+        """Test plugins can be deduplicated by value and cannot be modified."""
+        plugin1 = ValidationPlugin(name="plugin", version="1.0.0", description="Plugin", author="Author", validator_class=MockValidator, tags=["a", "b"])
+        plugin2 = ValidationPlugin(name="plugin", version="1.0.0", description="Plugin", author="Author", validator_class=MockValidator, tags=("a", "b"))
+
+        assert plugin1.tags == ("a", "b")
+        assert plugin1.dependencies == ()
+        assert len({plugin1, plugin2}) == 1
+
+        with pytest.raises(FrozenInstanceError):
+            plugin1.name = "renamed"  # type: ignore[misc]
+
+    def test_unregister_plugin(self, registry: PluginRegistry) -> None:
+        """Test unregistering plugins."""
         plugin = ValidationPlugin(name="test_plugin", version="1.0.0", description="Test plugin", author="Test Author", validator_class=MockValidator)
 
         registry.register_plugin(plugin)
@@ -190,10 +197,8 @@ class TestPluginRegistry:
         result = registry.unregister_plugin("nonexistent")
         assert result is False
 
-    def test_get_plugin_info(self) -> None:
+    def test_get_plugin_info(self, registry: PluginRegistry) -> None:
         """Test getting plugin information."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(
             name="info_test", version="2.0.0", description="Plugin for info testing", author="Info Author", validator_class=MockValidator, dependencies=["dep1", "dep2"], tags=["info", "test"], plugin_module="test.module"
         )
@@ -215,10 +220,8 @@ class TestPluginRegistry:
         info = registry.get_plugin_info("nonexistent")
         assert info is None
 
-    def test_clear_registry(self) -> None:
+    def test_clear_registry(self, registry: PluginRegistry) -> None:
         """Test clearing the registry."""
-        registry = PluginRegistry()
-
         plugin = ValidationPlugin(name="test_plugin", version="1.0.0", description="Test plugin", author="Test Author", validator_class=MockValidator)
 
         registry.register_plugin(plugin)
@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the task tests.
+"""
+
+from typing import Callable, Iterable
+
+import pytest
+
+
+def _assert_contains_all(text: str, needles: Iterable[str]) -> None:
+    """Assert that every needle occurs in text, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"Missing from text: {missing}"
+
+
+@pytest.fixture(scope="session")
+def assert_contains_all() -> Callable[[str, Iterable[str]], None]:
+    """Checker for prompt text that should contain several phrases."""
+    return _assert_contains_all
@@ -7,13 +7,26 @@ import pytest
 from validated_llm.tasks.code_refactoring import CleanCodeRefactoringTask, CodeRefactoringTask, ModernizationRefactoringTask, PerformanceRefactoringTask
 from validated_llm.validators.refactoring import RefactoringValidator
 
+# (task class, refactoring style, prompt markers, settings) for each specialized task
+SPECIALIZED_CASES = [
+    (PerformanceRefactoringTask, "performance", ["PERFORMANCE OPTIMIZATION:"], {"check_complexity": True}),
+    (CleanCodeRefactoringTask, "clean_code", ["CLEAN CODE PRINCIPLES:"], {"check_naming": True, "check_structure": True, "max_complexity": 8}),
+    (ModernizationRefactoringTask, "modern", ["MODERN CODE STYLE:", "latest language features"], {"check_structure": True}),
+]
+
+
+@pytest.fixture(scope="module")
+def default_refactoring_task():
+    """Default-configured task shared by tests that only read from it."""
+    return CodeRefactoringTask()
+
 
 class TestCodeRefactoringTask:
     """Test the CodeRefactoringTask."""
 
-    def test_task_initialization(self):
+    def test_task_initialization(self, default_refactoring_task):
         """Test task initialization with default parameters."""
-        task = CodeRefactoringTask()
+        task = default_refactoring_task
 
         assert task.name == "Python Code Refactoring"
         assert task.description == "Refactor python code to improve quality while preserving functionality"
@@ -31,22 +44,32 @@ class TestCodeRefactoringTask:
         assert task.name == "Javascript Code Refactoring"
         assert task.language == "javascript"
 
-    def test_validator_class(self):
+    def test_validator_class(self, default_refactoring_task):
         """Test that the correct validator class is used."""
-        task = CodeRefactoringTask()
+        task = default_refactoring_task
         assert task.validator_class == RefactoringValidator
 
-    def test_prompt_template_structure(self):
+    def test_prompt_template_structure(self, default_refactoring_task, assert_contains_all):
         """Test the structure of the prompt template."""
-        task = CodeRefactoringTask()
+        task = default_refactoring_task
         template = task.prompt_template
 
         # Check for key sections
-        assert "Refactor the following python code" in template
-        assert "REFACTORING REQUIREMENTS:" in template
-        assert "SPECIFIC IMPROVEMENTS TO FOCUS ON:" in template
-        assert "CONSTRAINTS:" in template
-        assert "Maximum cyclomatic complexity: 10" in template
+        assert_contains_all(template, ["Refactor the following python code", "REFACTORING REQUIREMENTS:", "SPECIFIC IMPROVEMENTS TO FOCUS ON:", "CONSTRAINTS:", "Maximum cyclomatic complexity: 10"])
+
+    def test_prompt_template_cached(self):
+        """Test the prompt template is reused until its settings change."""
+        task = CodeRefactoringTask()
+        template = task.prompt_template
+
+        assert task.prompt_template is template
+
+        task.refactoring_style = "performance"
+        task.max_complexity = 6
+        updated = task.prompt_template
+
+        assert "PERFORMANCE OPTIMIZATION:" in updated
+        assert "Maximum cyclomatic complexity: 6" in updated
 
     def test_prepare_prompt_data_basic(self):
         """Test basic prompt data preparation."""
@@ -77,59 +100,44 @@ def calculate_total(items):
 
         assert data["refactoring_goals"] == "reduce complexity, improve naming, add type hints"
 
-    def test_improvement_focus_generation(self):
+    def test_improvement_focus_generation(self, assert_contains_all):
         """Test generation of improvement focus based on configuration."""
         task = CodeRefactoringTask(check_complexity=True, check_naming=True, check_structure=True)
 
         data = task.prepare_prompt_data(original_code="def foo(): pass", focus_performance=True, focus_readability=True, extract_functions=True)
 
         focus = data["improvement_focus"]
-        assert "Reduce cyclomatic complexity" in focus
-        assert "clear, descriptive names" in focus
-        assert "Optimize for performance" in focus
-        assert "Prioritize readability" in focus
-        assert "Extract complex logic" in focus
+        assert_contains_all(focus, ["Reduce cyclomatic complexity", "clear, descriptive names", "Optimize for performance", "Prioritize readability", "Extract complex logic"])
 
-    def test_additional_constraints(self):
+    def test_additional_constraints(self, assert_contains_all):
         """Test generation of additional constraints."""
         task = CodeRefactoringTask()
 
         data = task.prepare_prompt_data(original_code="def foo(): pass", preserve_api=True, preserve_imports=True, preserve_comments=True, target_complexity=5)
 
         constraints = data["additional_constraints"]
-        assert "Preserve all public function/class interfaces" in constraints
-        assert "Keep the same imports" in constraints
-        assert "Preserve existing comments" in constraints
-        assert "Target complexity: 5" in constraints
+        assert_contains_all(constraints, ["Preserve all public function/class interfaces", "Keep the same imports", "Preserve existing comments", "Target complexity: 5"])
 
-    def test_clean_code_style(self):
+    def test_clean_code_style(self, assert_contains_all):
         """Test clean code refactoring style."""
         task = CodeRefactoringTask(refactoring_style="clean_code")
         template = task.prompt_template
 
-        assert "CLEAN CODE PRINCIPLES:" in template
-        assert "Single Responsibility" in template
-        assert "DRY (Don't Repeat Yourself)" in template
-        assert "KISS (Keep It Simple)" in template
+        assert_contains_all(template, ["CLEAN CODE PRINCIPLES:", "Single Responsibility", "DRY (Don't Repeat Yourself)", "KISS (Keep It Simple)"])
 
-    def test_performance_style(self):
+    def test_performance_style(self, assert_contains_all):
         """Test performance refactoring style."""
         task = CodeRefactoringTask(refactoring_style="performance")
         template = task.prompt_template
 
-        assert "PERFORMANCE OPTIMIZATION:" in template
-        assert "Minimize computational complexity" in template
-        assert "efficient data structures" in template
+        assert_contains_all(template, ["PERFORMANCE OPTIMIZATION:", "Minimize computational complexity", "efficient data structures"])
 
-    def test_functional_style(self):
+    def test_functional_style(self, assert_contains_all):
         """Test functional programming refactoring style."""
         task = CodeRefactoringTask(refactoring_style="functional")
         template = task.prompt_template
 
-        assert "FUNCTIONAL PROGRAMMING STYLE:" in template
-        assert "immutability" in template
-        assert "pure functions" in template
-        assert "map/filter/reduce" in template
+        assert_contains_all(template, ["FUNCTIONAL PROGRAMMING STYLE:", "immutability", "pure functions", "map/filter/reduce"])
 
     def test_configure_validator(self):
         """Test validator configuration."""
@@ -155,34 +163,15 @@ def calculate_total(items):
 class TestSpecializedRefactoringTasks:
     """Test specialized refactoring task variants."""
 
-    def test_performance_refactoring_task(self):
-        """Test PerformanceRefactoringTask."""
-        task = PerformanceRefactoringTask()
+    @pytest.mark.parametrize("task_class, style, template_markers, expected_settings", SPECIALIZED_CASES, ids=["performance", "clean_code", "modernization"])
+    def test_specialized_task_defaults(self, task_class, style, template_markers, expected_settings, assert_contains_all):
+        """Test each specialized task's style, settings and prompt section."""
+        task = task_class()
 
-        assert task.refactoring_style == "performance"
-        assert task.check_complexity is True
-        assert "PERFORMANCE OPTIMIZATION:" in task.prompt_template
-
-    def test_clean_code_refactoring_task(self):
-        """Test CleanCodeRefactoringTask."""
-        task = CleanCodeRefactoringTask()
-
-        assert task.refactoring_style == "clean_code"
-        assert task.check_naming is True
-        assert task.check_structure is True
-        assert task.max_complexity == 8
-        assert "CLEAN CODE PRINCIPLES:" in task.prompt_template
-
-    def test_modernization_refactoring_task(self):
-        """Test ModernizationRefactoringTask."""
-        task = ModernizationRefactoringTask()
-
-        assert task.refactoring_style == "modern"
-        assert task.check_structure is True
-
-        template = task.prompt_template
-        assert "MODERN CODE STYLE:" in template
-        assert "latest language features" in template
+        assert task.refactoring_style == style
+        for setting, expected in expected_settings.items():
+            assert getattr(task, setting) == expected, setting
+        assert_contains_all(task.prompt_template, template_markers)
 
     def test_specialized_task_custom_params(self):
         """Test specialized tasks with custom parameters."""
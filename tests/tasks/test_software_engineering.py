@@ -2,20 +2,80 @@
 Tests for software engineering tasks.
 """
 
-import json
-from typing import Any, Dict
-
 import pytest
 
+from validated_llm.base_validator import BaseValidator
+from validated_llm.tasks.base_task import BaseTask
 from validated_llm.tasks.software_engineering import AnalysisType, CodebaseAnalysisTask, RequirementsTask, RequirementType, UserStoryTask
 
+# Expected (member, value) pairs for the task enums
+ANALYSIS_TYPE_VALUES = (
+    (AnalysisType.ARCHITECTURE, "architecture"),
+    (AnalysisType.SECURITY, "security"),
+    (AnalysisType.PERFORMANCE, "performance"),
+    (AnalysisType.MAINTAINABILITY, "maintainability"),
+    (AnalysisType.QUALITY, "quality"),
+    (AnalysisType.DEPENDENCIES, "dependencies"),
+    (AnalysisType.TESTING, "testing"),
+    (AnalysisType.DOCUMENTATION, "documentation"),
+)
+REQUIREMENT_TYPE_VALUES = (
+    (RequirementType.FUNCTIONAL, "functional"),
+    (RequirementType.NON_FUNCTIONAL, "non_functional"),
+    (RequirementType.TECHNICAL, "technical"),
+    (RequirementType.BUSINESS, "business"),
+    (RequirementType.USER, "user"),
+    (RequirementType.SYSTEM, "system"),
+)
+
+
+# Interface every software engineering task must expose
+REQUIRED_TASK_ATTRS = frozenset({"name", "description", "prompt_template", "validator_class", "create_validator"})
+
+# Input placeholder each task's prompt template must contain
+PLACEHOLDER_EXPECTATIONS = (
+    (CodebaseAnalysisTask, "{codebase_content}"),
+    (RequirementsTask, "{project_description}"),
+    (UserStoryTask, "{product_requirements}"),
+)
+
+
+@pytest.fixture(scope="module")
+def default_codebase_task():
+    """Default-configured analysis task shared by tests that only read from it."""
+    return CodebaseAnalysisTask()
+
+
+@pytest.fixture(scope="module")
+def default_requirements_task():
+    """Default-configured requirements task shared by tests that only read from it."""
+    return RequirementsTask()
+
+
+@pytest.fixture(scope="module")
+def default_user_story_task():
+    """Default-configured user story task shared by tests that only read from it."""
+    return UserStoryTask()
+
+
+@pytest.fixture(scope="module")
+def default_tasks(default_codebase_task, default_requirements_task, default_user_story_task):
+    """All default-configured software engineering tasks."""
+    return (default_codebase_task, default_requirements_task, default_user_story_task)
+
+
+@pytest.fixture(scope="module")
+def default_validators(default_tasks):
+    """Validators of the default-configured tasks, created once per module."""
+    return tuple(task.create_validator() for task in default_tasks)
+
 
 class TestCodebaseAnalysisTask:
     """Test cases for CodebaseAnalysisTask."""
 
-    def test_task_initialization(self):
+    def test_task_initialization(self, default_codebase_task):
         """Test task initialization with default parameters."""
-        task = CodebaseAnalysisTask()
+        task = default_codebase_task
 
         assert task.name == "CodebaseAnalysisTask"
         assert "codebase analysis" in task.description.lower()
@@ -39,42 +99,30 @@ class TestCodebaseAnalysisTask:
         assert task.include_dependencies is False
         assert task.max_issues_per_category == 5
 
-    def test_prompt_template_content(self):
+    def test_prompt_template_content(self, assert_contains_all):
         """Test that prompt template contains required elements."""
         task = CodebaseAnalysisTask(analysis_types=[AnalysisType.SECURITY, AnalysisType.ARCHITECTURE], project_language="python")
 
         prompt = task.prompt_template
+        prompt_lower = prompt.lower()
 
-        # Check basic structure
-        assert "software architect" in prompt.lower()
-        assert "codebase" in prompt.lower()
-        assert "analysis" in prompt.lower()
+        # Check basic structure, analysis types and output format
+        assert_contains_all(prompt_lower, ["software architect", "codebase", "analysis", "security", "architecture", "json"])
 
-        # Check project information
-        assert "python" in prompt
-        assert "security" in prompt.lower()
-        assert "architecture" in prompt.lower()
+        # Check project information, output sections and codebase placeholder
+        assert_contains_all(prompt, ["python", "project_overview", "analysis_results", "recommendations", "{codebase_content}"])
 
-        # Check output requirements
-        assert "json" in prompt.lower()
-        assert "project_overview" in prompt
-        assert "analysis_results" in prompt
-        assert "recommendations" in prompt
-
-        # Check placeholder for codebase content
-        assert "{codebase_content}" in prompt
-
-    def test_validator_creation(self):
+    def test_validator_creation(self, default_codebase_task):
         """Test validator creation and configuration."""
-        task = CodebaseAnalysisTask()
+        task = default_codebase_task
         validator = task.create_validator()
 
         assert validator is not None
         assert hasattr(validator, "validate")
 
-    def test_schema_validation_structure(self):
+    def test_schema_validation_structure(self, default_codebase_task):
         """Test that the analysis schema has required structure."""
-        task = CodebaseAnalysisTask()
+        task = default_codebase_task
         schema = task._build_analysis_schema()
 
         # Check top-level structure
@@ -103,24 +151,22 @@ class TestCodebaseAnalysisTask:
         assert "security" in analysis_props
         assert "quality" in analysis_props
 
-    def test_analysis_types_enum(self):
+    @pytest.mark.parametrize("member, expected", ANALYSIS_TYPE_VALUES)
+    def test_analysis_types_enum(self, member, expected):
         """Test AnalysisType enum values."""
-        assert AnalysisType.ARCHITECTURE.value == "architecture"
-        assert AnalysisType.SECURITY.value == "security"
-        assert AnalysisType.PERFORMANCE.value == "performance"
-        assert AnalysisType.MAINTAINABILITY.value == "maintainability"
-        assert AnalysisType.QUALITY.value == "quality"
-        assert AnalysisType.DEPENDENCIES.value == "dependencies"
-        assert AnalysisType.TESTING.value == "testing"
-        assert AnalysisType.DOCUMENTATION.value == "documentation"
+        assert member.value == expected
+
+    def test_analysis_types_complete(self):
+        """Test AnalysisType has exactly the expected members."""
+        assert {member: member.value for member in AnalysisType} == dict(ANALYSIS_TYPE_VALUES)
 
 
 class TestRequirementsTask:
     """Test cases for RequirementsTask."""
 
-    def test_task_initialization(self):
+    def test_task_initialization(self, default_requirements_task):
         """Test task initialization with default parameters."""
-        task = RequirementsTask()
+        task = default_requirements_task
 
         assert task.name == "RequirementsTask"
         assert "requirements" in task.description.lower()
@@ -132,6 +178,14 @@ class TestRequirementsTask:
         assert task.include_priorities is True
         assert task.include_traceability is True
 
+    def test_default_settings_are_immutable(self, default_requirements_task):
+        """Test that default settings are immutable tuples shared between tasks."""
+        task = RequirementsTask()
+
+        assert isinstance(task.requirement_types, tuple)
+        assert task.stakeholders is default_requirements_task.stakeholders
+        assert task.compliance_standards == ()
+
     def test_task_initialization_custom_parameters(self):
         """Test task initialization with custom parameters."""
         req_types = [RequirementType.FUNCTIONAL, RequirementType.BUSINESS]
@@ -147,42 +201,30 @@ class TestRequirementsTask:
         assert task.include_acceptance_criteria is False
         assert task.min_requirements_per_type == 5
 
-    def test_prompt_template_content(self):
+    def test_prompt_template_content(self, assert_contains_all):
         """Test that prompt template contains required elements."""
         task = RequirementsTask(requirement_types=[RequirementType.FUNCTIONAL, RequirementType.TECHNICAL], stakeholders=["user", "admin"], compliance_standards=["HIPAA"])
 
         prompt = task.prompt_template
+        prompt_lower = prompt.lower()
 
-        # Check basic structure
-        assert "business analyst" in prompt.lower()
-        assert "requirements" in prompt.lower()
-
-        # Check project information
-        assert "functional" in prompt.lower()
-        assert "technical" in prompt.lower()
-        assert "user, admin" in prompt
-        assert "HIPAA" in prompt
-
-        # Check output requirements
-        assert "json" in prompt.lower()
-        assert "document_info" in prompt
-        assert "functional_requirements" in prompt
-        assert "technical_requirements" in prompt
+        # Check basic structure, requirement types and output format
+        assert_contains_all(prompt_lower, ["business analyst", "requirements", "functional", "technical", "json"])
 
-        # Check placeholder for project description
-        assert "{project_description}" in prompt
+        # Check project information, output sections and description placeholder
+        assert_contains_all(prompt, ["user, admin", "HIPAA", "document_info", "functional_requirements", "technical_requirements", "{project_description}"])
 
-    def test_validator_creation(self):
+    def test_validator_creation(self, default_requirements_task):
         """Test validator creation and configuration."""
-        task = RequirementsTask()
+        task = default_requirements_task
         validator = task.create_validator()
 
         assert validator is not None
         assert hasattr(validator, "validate")
 
-    def test_schema_validation_structure(self):
+    def test_schema_validation_structure(self, default_requirements_task):
         """Test that the requirements schema has required structure."""
-        task = RequirementsTask()
+        task = default_requirements_task
         schema = task._build_requirements_schema()
 
         # Check top-level structure
@@ -211,22 +253,22 @@ class TestRequirementsTask:
         assert "priority" in req_item
         assert "acceptance_criteria" in req_item
 
-    def test_requirement_types_enum(self):
+    @pytest.mark.parametrize("member, expected", REQUIREMENT_TYPE_VALUES)
+    def test_requirement_types_enum(self, member, expected):
         """Test RequirementType enum values."""
-        assert RequirementType.FUNCTIONAL.value == "functional"
-        assert RequirementType.NON_FUNCTIONAL.value == "non_functional"
-        assert RequirementType.TECHNICAL.value == "technical"
-        assert RequirementType.BUSINESS.value == "business"
-        assert RequirementType.USER.value == "user"
-        assert RequirementType.SYSTEM.value == "system"
+        assert member.value == expected
+
+    def test_requirement_types_complete(self):
+        """Test RequirementType has exactly the expected members."""
+        assert {member: member.value for member in RequirementType} == dict(REQUIREMENT_TYPE_VALUES)
 
 
 class TestUserStoryTask:
     """Test cases for UserStoryTask."""
 
-    def test_task_initialization(self):
+    def test_task_initialization(self, default_user_story_task):
         """Test task initialization with default parameters."""
-        task = UserStoryTask()
+        task = default_user_story_task
 
         assert task.name == "UserStoryTask"
         assert "user stories" in task.description.lower()
@@ -253,45 +295,30 @@ class TestUserStoryTask:
         assert task.min_stories == 3
         assert task.max_stories == 10
 
-    def test_prompt_template_content(self):
+    def test_prompt_template_content(self, assert_contains_all):
         """Test that prompt template contains required elements."""
         task = UserStoryTask(persona_types=["user", "admin"], include_acceptance_criteria=True, epic_organization=True)
 
         prompt = task.prompt_template
+        prompt_lower = prompt.lower()
 
-        # Check basic structure
-        assert "product owner" in prompt.lower()
-        assert "user stories" in prompt.lower()
-        assert "agile" in prompt.lower()
-
-        # Check format information
-        assert "As a [persona]" in prompt
-        assert "I want [functionality]" in prompt
-        assert "so that [benefit" in prompt
-
-        # Check conditional content
-        assert "given-when-then" in prompt.lower()
-        assert "epics" in prompt.lower()
+        # Check basic structure, conditional content and output format
+        assert_contains_all(prompt_lower, ["product owner", "user stories", "agile", "given-when-then", "epics", "json"])
 
-        # Check output requirements
-        assert "json" in prompt.lower()
-        assert "user_stories" in prompt
-        assert "acceptance_criteria" in prompt
+        # Check story format, output sections and requirements placeholder
+        assert_contains_all(prompt, ["As a [persona]", "I want [functionality]", "so that [benefit", "user_stories", "acceptance_criteria", "{product_requirements}"])
 
-        # Check placeholder for requirements
-        assert "{product_requirements}" in prompt
-
-    def test_validator_creation(self):
+    def test_validator_creation(self, default_user_story_task):
         """Test validator creation and configuration."""
-        task = UserStoryTask()
+        task = default_user_story_task
         validator = task.create_validator()
 
         assert validator is not None
         assert hasattr(validator, "validate")
 
-    def test_schema_validation_structure(self):
+    def test_schema_validation_structure(self, default_user_story_task):
         """Test that the user story schema has required structure."""
-        task = UserStoryTask()
+        task = default_user_story_task
         schema = task._build_story_schema()
 
         # Check top-level structure
@@ -328,9 +355,13 @@ class TestUserStoryTask:
         assert "when" in ac_item
         assert "then" in ac_item
 
-    def test_story_points_validation(self):
+    def test_schema_shared_across_instances(self):
+        """Test that the story schema is built once and shared between tasks."""
+        assert UserStoryTask()._build_story_schema() is UserStoryTask(min_stories=1)._build_story_schema()
+
+    def test_story_points_validation(self, default_user_story_task):
         """Test story points validation range."""
-        task = UserStoryTask()
+        task = default_user_story_task
         schema = task._build_story_schema()
 
         story_points = schema["properties"]["user_stories"]["items"]["properties"]["story_points"]
@@ -338,9 +369,9 @@ class TestUserStoryTask:
         assert story_points["minimum"] == 1
         assert story_points["maximum"] == 21  # Common Fibonacci sequence max
 
-    def test_priority_enum_validation(self):
+    def test_priority_enum_validation(self, default_user_story_task):
         """Test priority enum validation."""
-        task = UserStoryTask()
+        task = default_user_story_task
         schema = task._build_story_schema()
 
         priority = schema["properties"]["user_stories"]["items"]["properties"]["priority"]
@@ -355,20 +386,13 @@ class TestUserStoryTask:
 class TestSoftwareEngineeringTasksIntegration:
     """Integration tests for software engineering tasks."""
 
-    def test_all_tasks_have_consistent_interface(self):
+    def test_all_tasks_have_consistent_interface(self, default_tasks):
         """Test that all tasks implement the required interface consistently."""
-        tasks = [CodebaseAnalysisTask(), RequirementsTask(), UserStoryTask()]
-
-        for task in tasks:
-            # Check required properties
-            assert hasattr(task, "name")
-            assert hasattr(task, "description")
-            assert hasattr(task, "prompt_template")
-            assert hasattr(task, "validator_class")
-
-            # Check required methods
-            assert hasattr(task, "create_validator")
-            assert callable(task.create_validator)
+        for task in default_tasks:
+            # BaseTask declares the required properties and methods
+            assert isinstance(task, BaseTask)
+            missing = REQUIRED_TASK_ATTRS - set(dir(task))
+            assert not missing, missing
 
             # Check that properties return appropriate types
             assert isinstance(task.name, str)
@@ -378,30 +402,21 @@ class TestSoftwareEngineeringTasksIntegration:
             assert len(task.description) > 0
             assert len(task.prompt_template) > 0
 
-    def test_validator_creation_consistency(self):
+    def test_validator_creation_consistency(self, default_tasks, default_validators):
         """Test that all tasks create valid validators."""
-        tasks = [CodebaseAnalysisTask(), RequirementsTask(), UserStoryTask()]
-
-        for task in tasks:
-            validator = task.create_validator()
+        for task, validator in zip(default_tasks, default_validators):
+            assert isinstance(validator, BaseValidator)
+            assert task.create_validator() is validator
 
-            # Check validator interface
-            assert hasattr(validator, "validate")
-            assert callable(validator.validate)
-
-    def test_prompt_template_placeholders(self):
+    @pytest.mark.parametrize("task_factory, placeholder", PLACEHOLDER_EXPECTATIONS)
+    def test_prompt_template_placeholders(self, task_factory, placeholder):
         """Test that prompt templates contain expected placeholders."""
-        test_cases = [(CodebaseAnalysisTask(), "{codebase_content}"), (RequirementsTask(), "{project_description}"), (UserStoryTask(), "{product_requirements}")]
-
-        for task, expected_placeholder in test_cases:
-            prompt = task.prompt_template
-            assert expected_placeholder in prompt, f"Missing placeholder in {task.name}"
+        task = task_factory()
+        assert placeholder in task.prompt_template, f"Missing placeholder in {task.name}"
 
-    def test_json_output_requirements(self):
+    def test_json_output_requirements(self, default_tasks):
         """Test that all tasks require JSON output."""
-        tasks = [CodebaseAnalysisTask(), RequirementsTask(), UserStoryTask()]
-
-        for task in tasks:
+        for task in default_tasks:
             prompt = task.prompt_template
             assert "json" in prompt.lower(), f"Missing JSON requirement in {task.name}"
             assert "```json" in prompt, f"Missing JSON example in {task.name}"
@@ -0,0 +1,89 @@
+"""
+Tests for the StoryToScenesTask validator using a known-good model response.
+"""
+
+import pytest
+import yaml
+
+from validated_llm.tasks import StoryToScenesTask
+from validated_llm.tasks.story_to_scenes import StoryToScenesValidator
+
+REQUIRED_SECTIONS = ("image", "audio", "caption")
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Validator shared by tests that only call validate()."""
+    return StoryToScenesTask().create_validator()
+
+
+def test_validator_class():
+    """Test the task creates a StoryToScenesValidator."""
+    assert StoryToScenesTask().validator_class is StoryToScenesValidator
+
+
+def test_known_good_output_is_valid(validator, story_scenes_output):
+    """Test the known-good response passes validation without warnings."""
+    result = validator.validate(story_scenes_output)
+
+    assert result.is_valid, result.errors
+    assert result.warnings == []
+
+
+def test_known_good_output_shape(story_scenes_output):
+    """Test the known-good response has the scene structure the prompt asks for."""
+    assert "```" not in story_scenes_output
+    scenes = yaml.safe_load(story_scenes_output)
+
+    assert [scene["id"] for scene in scenes] == [1, 2, 3]
+    for scene in scenes:
+        missing = [section for section in REQUIRED_SECTIONS if section not in scene]
+        assert not missing, f"Scene {scene['id']} missing sections: {missing}"
+        assert scene["image"]["style"] in {"photorealistic", "cinematic", "artistic"}
+        assert scene["audio"]["narration"]
+        assert scene["caption"]["text"]
+
+
+def test_style_keyword_in_prompt_rejected(validator, story_scenes_output):
+    """Test style words in the image prompt are reported."""
+    output = story_scenes_output.replace("A ginger cat sitting", "A cinematic ginger cat sitting")
+
+    result = validator.validate(output)
+
+    assert not result.is_valid
+    assert result.errors == ["Scene 1: image prompt contains style keyword 'cinematic' - use separate 'style' field instead"]
+
+
+def test_style_keywords_reported_in_order(validator, story_scenes_output):
+    """Test every style word is reported once, in keyword order, including inside longer words."""
+    output = story_scenes_output.replace("A ginger cat sitting", "A restyled, cinematic and photorealistic cinematic cat sitting")
+
+    result = validator.validate(output)
+
+    assert [error.split("'")[1] for error in result.errors] == ["photorealistic", "cinematic", "style"]
+
+
+def test_overlapping_style_keywords_all_reported(validator, story_scenes_output):
+    """Test keywords that share letters are each reported."""
+    output = story_scenes_output.replace("A ginger cat sitting", "An artisticinematic cat sitting")
+
+    result = validator.validate(output)
+
+    assert [error.split("'")[1] for error in result.errors] == ["cinematic", "artistic"]
+
+
+def test_missing_sections_reported(validator):
+    """Test scenes without the required sections are reported."""
+    result = validator.validate("- id: 1\n  image:\n    prompt: 'A quiet street at night'\n    style: 'cinematic'\n")
+
+    assert not result.is_valid
+    assert "Scene 1: Missing required field 'audio'" in result.errors
+    assert "Scene 1: Missing required field 'caption'" in result.errors
+
+
+def test_non_list_output_rejected(validator):
+    """Test output that isn't a list of scenes is rejected."""
+    result = validator.validate("title: Not a scene list")
+
+    assert not result.is_valid
+    assert result.errors == ["Output must be a list of scenes"]
@@ -18,19 +18,72 @@ from validated_llm.validators.json_schema import JSONSchemaValidator
 from validated_llm.validators.range import RangeValidator
 
 
+class _VirtualTimeSelector:
+    """Selector wrapper that skips ahead in virtual time instead of waiting for timers."""
+
+    def __init__(self, selector: Any, loop: "TimeTravelLoop"):
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None) -> Any:
+        if timeout is not None and timeout > 0:
+            # Nothing is ready before the next timer, so jump straight to it
+            self._loop.advance(timeout)
+            timeout = 0
+        return self._selector.select(timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class TimeTravelLoop(asyncio.SelectorEventLoop):
+    """Event loop running on a virtual clock, so asyncio.sleep() returns immediately.
+
+    Timers still fire in order and concurrent sleeps still overlap, which lets
+    tests assert on loop.time() deltas without spending real time.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._virtual_time = 0.0
+        self._selector = _VirtualTimeSelector(self._selector, self)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+
+class TimeTravelLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy creating TimeTravelLoop instances."""
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        return TimeTravelLoop()
+
+
+# Default simulated validation latency; short, since real-time tests pay it in full
+DELAY = 0.01
+
+
 class MockAsyncValidator(AsyncBaseValidator):
     """Mock async validator for testing."""
 
-    def __init__(self, name: str = "MockAsyncValidator", should_pass: bool = True, delay: float = 0.1):
+    def __init__(self, name: str = "MockAsyncValidator", should_pass: bool = True, delay: float = DELAY, gate: Optional[asyncio.Event] = None):
         super().__init__(name=name, description="Mock async validator for testing")
         self.should_pass = should_pass
         self.delay = delay
         self.validation_count = 0
+        # When set, block on the event instead of sleeping so tests can release validators explicitly
+        self._gate = gate
 
     async def validate_async(self, output: str, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
-        """Mock async validation with configurable delay."""
+        """Mock async validation with configurable delay or gate."""
         self.validation_count += 1
-        await asyncio.sleep(self.delay)
+        if self._gate is not None:
+            await self._gate.wait()
+        else:
+            await asyncio.sleep(self.delay)
 
         if self.should_pass:
             return ValidationResult(is_valid=True, errors=[], metadata={"mock_validator": True, "validation_count": self.validation_count})
@@ -38,10 +91,18 @@ class MockAsyncValidator(AsyncBaseValidator):
             return ValidationResult(is_valid=False, errors=[f"Mock validation failed on attempt {self.validation_count}"], metadata={"mock_validator": True, "validation_count": self.validation_count})
 
 
+async def yield_until(predicate: Any, max_yields: int = 10) -> bool:
+    """Yield to the event loop until predicate() holds, giving up after max_yields iterations."""
+    for _ in range(max_yields):
+        if predicate():
+            return True
+        await asyncio.sleep(0)
+    return bool(predicate())
+
+
 class TestAsyncBaseValidator:
     """Test cases for AsyncBaseValidator."""
 
-    @pytest.mark.asyncio
     async def test_mock_validator_success(self):
         """Test mock validator with successful validation."""
         validator = MockAsyncValidator(should_pass=True)
@@ -52,7 +113,6 @@ class TestAsyncBaseValidator:
         assert result.metadata["mock_validator"] is True
         assert result.metadata["validation_count"] == 1
 
-    @pytest.mark.asyncio
     async def test_mock_validator_failure(self):
         """Test mock validator with failed validation."""
         validator = MockAsyncValidator(should_pass=False)
@@ -74,7 +134,6 @@ class TestAsyncBaseValidator:
 class TestAsyncValidatorAdapter:
     """Test cases for AsyncValidatorAdapter."""
 
-    @pytest.mark.asyncio
     async def test_sync_validator_adaptation(self):
         """Test wrapping synchronous validator in async adapter."""
         # Create a sync validator
@@ -105,33 +164,38 @@ class TestAsyncValidatorAdapter:
 
 
 class TestAsyncCompositeValidator:
-    """Test cases for AsyncCompositeValidator."""
+    """Test cases for AsyncCompositeValidator, run on a virtual clock."""
+
+    @pytest.fixture
+    def event_loop_policy(self) -> asyncio.AbstractEventLoopPolicy:
+        return TimeTravelLoopPolicy()
 
-    @pytest.mark.asyncio
     async def test_and_logic_all_pass(self):
         """Test AND logic with all validators passing."""
+        gate = asyncio.Event()
         validators = [
-            MockAsyncValidator("validator1", should_pass=True, delay=0.1),
-            MockAsyncValidator("validator2", should_pass=True, delay=0.1),
+            MockAsyncValidator("validator1", should_pass=True, gate=gate),
+            MockAsyncValidator("validator2", should_pass=True, gate=gate),
         ]
 
         composite = AsyncCompositeValidator(validators, operator="AND", concurrent=True)
+        task = asyncio.ensure_future(composite.validate_async("test"))
 
-        start_time = time.time()
-        result = await composite.validate_async("test")
-        execution_time = time.time() - start_time
+        # Both validators are started before either is released, so they run concurrently
+        assert await yield_until(lambda: all(v.validation_count == 1 for v in validators))
+        assert not task.done()
+
+        gate.set()
+        result = await task
 
         assert result.is_valid
         assert len(result.errors) == 0
-        # Should run concurrently, so total time < sum of delays
-        assert execution_time < 0.3
 
-    @pytest.mark.asyncio
     async def test_and_logic_one_fails(self):
         """Test AND logic with one validator failing."""
         validators = [
-            MockAsyncValidator("validator1", should_pass=True, delay=0.1),
-            MockAsyncValidator("validator2", should_pass=False, delay=0.1),
+            MockAsyncValidator("validator1", should_pass=True, delay=DELAY),
+            MockAsyncValidator("validator2", should_pass=False, delay=DELAY),
         ]
 
         composite = AsyncCompositeValidator(validators, operator="AND", concurrent=True)
@@ -141,12 +205,29 @@ class TestAsyncCompositeValidator:
         assert len(result.errors) > 0
         assert "[validator2]" in result.errors[0]
 
-    @pytest.mark.asyncio
+    async def test_and_logic_one_fails_cancels_others(self):
+        """Test AND logic stops at the first failure and cancels slower validators."""
+        slow = MockAsyncValidator("validator1", should_pass=True, delay=5.0)
+        failing = MockAsyncValidator("validator2", should_pass=False, delay=DELAY)
+
+        composite = AsyncCompositeValidator([slow, failing], operator="AND", concurrent=True)
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        result = await composite.validate_async("test")
+        execution_time = loop.time() - start_time
+
+        assert not result.is_valid
+        assert execution_time == pytest.approx(DELAY)
+        assert slow.validation_count == 1
+        assert [r["validator"] for r in result.metadata["results"]] == ["validator2"]
+        assert result.errors[0].startswith("[validator2]")
+
     async def test_or_logic_one_passes(self):
         """Test OR logic with one validator passing."""
         validators = [
-            MockAsyncValidator("validator1", should_pass=False, delay=0.1),
-            MockAsyncValidator("validator2", should_pass=True, delay=0.1),
+            MockAsyncValidator("validator1", should_pass=False, delay=DELAY),
+            MockAsyncValidator("validator2", should_pass=True, delay=DELAY),
         ]
 
         composite = AsyncCompositeValidator(validators, operator="OR", concurrent=True)
@@ -154,29 +235,28 @@ class TestAsyncCompositeValidator:
 
         assert result.is_valid
 
-    @pytest.mark.asyncio
     async def test_sequential_execution(self):
         """Test sequential execution mode."""
         validators = [
-            MockAsyncValidator("validator1", should_pass=True, delay=0.1),
-            MockAsyncValidator("validator2", should_pass=True, delay=0.1),
+            MockAsyncValidator("validator1", should_pass=True, delay=DELAY),
+            MockAsyncValidator("validator2", should_pass=True, delay=DELAY),
         ]
 
         composite = AsyncCompositeValidator(validators, operator="AND", concurrent=False)
 
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         result = await composite.validate_async("test")
-        execution_time = time.time() - start_time
+        execution_time = loop.time() - start_time
 
         assert result.is_valid
-        # Should run sequentially, so total time >= sum of delays
-        assert execution_time >= 0.2
+        # Should run sequentially, so total time is the sum of delays
+        assert execution_time == pytest.approx(2 * DELAY)
 
-    @pytest.mark.asyncio
     async def test_mixed_sync_async_validators(self):
         """Test composite validator with mixed sync and async validators."""
         validators = [
-            MockAsyncValidator("async_validator", should_pass=True, delay=0.1),
+            MockAsyncValidator("async_validator", should_pass=True, delay=DELAY),
             RangeValidator(min_value=1, max_value=10, value_type="integer"),  # Sync validator
         ]
 
@@ -186,15 +266,35 @@ class TestAsyncCompositeValidator:
         assert result.is_valid
 
 
+class TestAsyncCompositeValidatorRealTime:
+    """Smoke test for AsyncCompositeValidator concurrency on a real event loop."""
+
+    async def test_concurrent_execution_overlaps(self):
+        """Test that concurrent validators overlap their real sleeps."""
+        validators = [
+            MockAsyncValidator("validator1", should_pass=True, delay=0.05),
+            MockAsyncValidator("validator2", should_pass=True, delay=0.05),
+        ]
+
+        composite = AsyncCompositeValidator(validators, operator="AND", concurrent=True)
+
+        start_time = time.time()
+        result = await composite.validate_async("test")
+        execution_time = time.time() - start_time
+
+        assert result.is_valid
+        # Should run concurrently, so total time < sum of delays
+        assert execution_time < 0.1
+
+
 class TestAsyncFunctionValidator:
     """Test cases for AsyncFunctionValidator."""
 
-    @pytest.mark.asyncio
     async def test_async_function_validator(self):
         """Test validator with async function."""
 
         async def async_validation_func(output: str) -> bool:
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(DELAY)
             return "valid" in output.lower()
 
         validator = AsyncFunctionValidator(async_validation_func, name="test_async")
@@ -205,7 +305,6 @@ class TestAsyncFunctionValidator:
         result = await validator.validate_async("This is bad")
         assert not result.is_valid
 
-    @pytest.mark.asyncio
     async def test_sync_function_validator(self):
         """Test validator with sync function (run in thread pool)."""
 
@@ -220,7 +319,22 @@ class TestAsyncFunctionValidator:
         result = await validator.validate_async("long enough")
         assert result.is_valid
 
-    @pytest.mark.asyncio
+    async def test_sync_function_validator_inline(self, monkeypatch):
+        """Test sync function run inline skips the thread pool."""
+
+        def fail_executor(*args, **kwargs):
+            raise AssertionError("run_in_executor should not be used")
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "run_in_executor", fail_executor)
+
+        validator = AsyncFunctionValidator(lambda output: len(output) > 5, name="test_inline", run_inline=True)
+
+        result = await validator.validate_async("short")
+        assert not result.is_valid
+
+        result = await validator.validate_async("long enough")
+        assert result.is_valid
+
     async def test_function_validator_exception(self):
         """Test function validator with exception handling."""
 
@@ -234,34 +348,31 @@ class TestAsyncFunctionValidator:
         assert "Test exception" in result.errors[0]
 
 
+@pytest.fixture(scope="module")
+def person_schema_validator():
+    """Async JSON schema validator for a person record, built once per module."""
+    schema = {"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}}, "required": ["name", "age"]}
+    return AsyncJSONSchemaValidator(schema)
+
+
 class TestAsyncJSONSchemaValidator:
     """Test cases for AsyncJSONSchemaValidator."""
 
-    @pytest.mark.asyncio
-    async def test_valid_json_schema(self):
+    async def test_valid_json_schema(self, person_schema_validator):
         """Test async JSON schema validation with valid input."""
-        schema = {"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}}, "required": ["name", "age"]}
-
-        validator = AsyncJSONSchemaValidator(schema)
-        result = await validator.validate_async('{"name": "John", "age": 30}')
+        result = await person_schema_validator.validate_async('{"name": "John", "age": 30}')
 
         assert result.is_valid
         assert len(result.errors) == 0
         assert result.metadata["async_validation"] is True
 
-    @pytest.mark.asyncio
-    async def test_invalid_json_schema(self):
+    async def test_invalid_json_schema(self, person_schema_validator):
         """Test async JSON schema validation with invalid input."""
-        schema = {"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}}, "required": ["name", "age"]}
-
-        validator = AsyncJSONSchemaValidator(schema)
-
         # Missing required field
-        result = await validator.validate_async('{"name": "John"}')
+        result = await person_schema_validator.validate_async('{"name": "John"}')
         assert not result.is_valid
         assert "age" in str(result.errors)
 
-    @pytest.mark.asyncio
     async def test_invalid_json_syntax(self):
         """Test async JSON schema validation with invalid JSON syntax."""
         schema = {"type": "object"}
@@ -271,11 +382,16 @@ class TestAsyncJSONSchemaValidator:
         assert not result.is_valid
         assert "Invalid JSON" in result.errors[0]
 
+    def test_compiled_schema_shared_with_sync_validator(self, person_schema_validator):
+        """Test the async validator reuses the sync validator's compiled schema."""
+        sync_validator = JSONSchemaValidator(person_schema_validator.schema)
+
+        assert sync_validator.validator is person_schema_validator.validator
+
 
 class TestAsyncRangeValidator:
     """Test cases for AsyncRangeValidator."""
 
-    @pytest.mark.asyncio
     async def test_number_in_range(self):
         """Test async range validation with number in range."""
         validator = AsyncRangeValidator(min_value=1, max_value=10, value_type="number")
@@ -284,7 +400,6 @@ class TestAsyncRangeValidator:
         assert result.is_valid
         assert result.metadata["async_validation"] is True
 
-    @pytest.mark.asyncio
     async def test_number_out_of_range(self):
         """Test async range validation with number out of range."""
         validator = AsyncRangeValidator(min_value=1, max_value=10, value_type="number")
@@ -293,7 +408,6 @@ class TestAsyncRangeValidator:
         assert not result.is_valid
         assert "out of range" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_integer_validation(self):
         """Test async range validation with integer type."""
         validator = AsyncRangeValidator(min_value=1, max_value=10, value_type="integer")
@@ -62,6 +62,15 @@ function bar() {}
         assert python_blocks[0]["language"] == "python"
         assert "def foo()" in python_blocks[0]["code"]
 
+    def test_extract_code_blocks_line_numbers(self):
+        """Test code blocks report the line they start on."""
+        markdown = "Intro\n```python\nx = 1\n```\n\nText\n```\nplain\n```\n```javascript\nlet y;\n```"
+
+        blocks = CodeFormatter.extract_code_blocks(markdown)
+
+        assert [(block["language"], block["line_number"]) for block in blocks] == [("python", 2), ("text", 7), ("javascript", 10)]
+        assert CodeFormatter.extract_code_blocks(markdown, language="javascript")[0]["line_number"] == 10
+
     def test_extract_indented_code_blocks(self):
         """Test extracting indented code blocks."""
         text = """
@@ -140,29 +149,40 @@ That's the code.
 class TestCodeImporter:
     """Test the CodeImporter class."""
 
-    def test_from_jupyter(self, tmp_path):
-        """Test importing from Jupyter notebook."""
-        # Create a simple notebook
+    def test_from_jupyter_data(self):
+        """Test importing from parsed Jupyter notebook data."""
         notebook = {
             "cells": [
                 {"cell_type": "code", "execution_count": 1, "metadata": {}, "outputs": [], "source": ["print('Hello')\n", "x = 42"]},
                 {"cell_type": "markdown", "metadata": {}, "source": ["# Title"]},
                 {"cell_type": "code", "execution_count": 2, "metadata": {"tags": ["test"]}, "outputs": [], "source": ["def foo():\n", "    return 'bar'"]},
+                {"cell_type": "code", "execution_count": 3, "metadata": {}, "outputs": [], "source": "y = 1\nz = 2"},
             ],
             "metadata": {"kernelspec": {"language": "python"}},
         }
 
+        cells = CodeImporter.from_jupyter_data(notebook)
+
+        assert len(cells) == 3  # Only code cells
+        assert cells[0]["code"] == "print('Hello')\nx = 42"
+        assert cells[0]["language"] == "python"
+        assert cells[1]["code"] == "def foo():\n    return 'bar'"
+        assert cells[1]["metadata"]["tags"] == ["test"]
+        # Single-string source is used as-is
+        assert cells[2]["code"] == "y = 1\nz = 2"
+
+    def test_from_jupyter(self, tmp_path):
+        """Test importing from a Jupyter notebook file."""
+        notebook = {"cells": [{"cell_type": "code", "execution_count": 1, "metadata": {}, "outputs": [], "source": ["x = 42"]}], "metadata": {"kernelspec": {"language": "python"}}}
+
         notebook_path = tmp_path / "test.ipynb"
         with open(notebook_path, "w") as f:
             json.dump(notebook, f)
 
         cells = CodeImporter.from_jupyter(notebook_path)
 
-        assert len(cells) == 2  # Only code cells
-        assert cells[0]["code"] == "print('Hello')\nx = 42"
-        assert cells[0]["language"] == "python"
-        assert cells[1]["code"] == "def foo():\n    return 'bar'"
-        assert cells[1]["metadata"]["tags"] == ["test"]
+        assert cells == CodeImporter.from_jupyter_data(notebook)
+        assert cells[0]["code"] == "x = 42"
 
     def test_from_markdown(self):
         """Test importing from markdown."""
@@ -1,15 +1,52 @@
 """Tests for configuration management."""
 
-import os
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from validated_llm.config import ConfigLoader, ValidatedLLMConfig, create_sample_config, get_config, get_task_config, get_validator_config, load_config
+from validated_llm.config import ConfigLoader, ValidatedLLMConfig, _parse_yaml_file, create_sample_config, get_config, get_task_config, get_validator_config, load_config
 from validated_llm.validators.config import ConfigValidator
 
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+
+FAKE_PROJECT = "/fake/validated-llm-project"
+
+
+@pytest.fixture
+def fake_config(monkeypatch):
+    """Serve config files from a {path: data} mapping instead of the filesystem.
+
+    Paths missing from the mapping behave like missing files, which also hides any real global config.
+    """
+
+    def install(files):
+        contents = {str(Path(path)): data for path, data in files.items()}
+
+        def read_yaml(self, path):
+            try:
+                return contents[str(path)]
+            except KeyError:
+                raise FileNotFoundError(path) from None
+
+        monkeypatch.setattr(ConfigLoader, "_read_yaml", read_yaml)
+
+    return install
+
+
+@pytest.fixture
+def validated_llm_env(monkeypatch):
+    """Set VALIDATED_LLM_* environment variables for one test, restored automatically afterwards."""
+
+    def set_env(key, value):
+        monkeypatch.setenv(f"VALIDATED_LLM_{key}", value)
+
+    return set_env
+
 
 class TestValidatedLLMConfig:
     """Test cases for ValidatedLLMConfig."""
@@ -77,22 +114,16 @@ class TestConfigLoader:
         assert config.llm_model == "gemma3:27b"
         assert config.max_retries == 3
 
-    def test_load_project_config(self):
+    def test_load_project_config(self, fake_config):
         """Test loading project configuration file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create config file
-            config_path = Path(tmpdir) / ".validated-llm.yml"
-            config_data = {"llm_model": "custom-model", "max_retries": 5, "code_language": "javascript"}
-            with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+        fake_config({f"{FAKE_PROJECT}/.validated-llm.yml": {"llm_model": "custom-model", "max_retries": 5, "code_language": "javascript"}})
 
-            # Load config
-            loader = ConfigLoader()
-            config = loader.load_config(tmpdir)
+        loader = ConfigLoader()
+        config = loader.load_config(FAKE_PROJECT)
 
-            assert config.llm_model == "custom-model"
-            assert config.max_retries == 5
-            assert config.code_language == "javascript"
+        assert config.llm_model == "custom-model"
+        assert config.max_retries == 5
+        assert config.code_language == "javascript"
 
     def test_load_nested_project_config(self):
         """Test loading config from parent directory."""
@@ -106,7 +137,7 @@ class TestConfigLoader:
             config_path = root_dir / ".validated-llm.yml"
             config_data = {"llm_model": "parent-model"}
             with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+                yaml.dump(config_data, f, Dumper=YamlSafeDumper)
 
             # Load from subdirectory
             loader = ConfigLoader()
@@ -114,50 +145,42 @@ class TestConfigLoader:
 
             assert config.llm_model == "parent-model"
 
-    def test_load_env_config(self):
+    def test_load_env_config(self, validated_llm_env):
         """Test loading configuration from environment variables."""
-        # Set environment variables
-        env_vars = {"VALIDATED_LLM_MODEL": "env-model", "VALIDATED_LLM_TEMPERATURE": "0.5", "VALIDATED_LLM_MAX_RETRIES": "7", "VALIDATED_LLM_VERBOSE": "true"}
-
+        env_vars = {"MODEL": "env-model", "TEMPERATURE": "0.5", "MAX_RETRIES": "7", "VERBOSE": "true"}
         for key, value in env_vars.items():
-            os.environ[key] = value
+            validated_llm_env(key, value)
 
-        try:
-            loader = ConfigLoader()
-            config = loader.load_config()
-
-            assert config.llm_model == "env-model"
-            assert config.llm_temperature == 0.5
-            assert config.max_retries == 7
-            assert config.verbose is True
-        finally:
-            # Clean up
-            for key in env_vars:
-                os.environ.pop(key, None)
-
-    def test_config_precedence(self):
+        loader = ConfigLoader()
+        config = loader.load_config()
+
+        assert config.llm_model == "env-model"
+        assert config.llm_temperature == 0.5
+        assert config.max_retries == 7
+        assert config.verbose is True
+
+    def test_config_precedence(self, fake_config, validated_llm_env):
         """Test configuration precedence (env > project > global > default)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create project config
-            config_path = Path(tmpdir) / ".validated-llm.yml"
-            config_data = {"llm_model": "project-model", "max_retries": 4, "code_language": "go"}
-            with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+        fake_config(
+            {
+                f"{ConfigLoader.GLOBAL_CONFIG_DIR}/config.yml": {"llm_model": "global-model", "max_retries": 2, "timeout_seconds": 90},
+                f"{FAKE_PROJECT}/.validated-llm.yml": {"llm_model": "project-model", "max_retries": 4, "code_language": "go"},
+            }
+        )
 
-            # Set environment variable (should override project)
-            os.environ["VALIDATED_LLM_MODEL"] = "env-model"
+        # Set environment variable (should override project)
+        validated_llm_env("MODEL", "env-model")
 
-            try:
-                loader = ConfigLoader()
-                config = loader.load_config(tmpdir)
+        loader = ConfigLoader()
+        config = loader.load_config(FAKE_PROJECT)
 
-                # Environment should override project
-                assert config.llm_model == "env-model"
-                # Project value should be used
-                assert config.max_retries == 4
-                assert config.code_language == "go"
-            finally:
-                os.environ.pop("VALIDATED_LLM_MODEL", None)
+        # Environment should override project
+        assert config.llm_model == "env-model"
+        # Project value should override global
+        assert config.max_retries == 4
+        assert config.code_language == "go"
+        # Global value should override default
+        assert config.timeout_seconds == 90
 
     def test_invalid_config_file(self):
         """Test handling of invalid configuration file."""
@@ -165,57 +188,88 @@ class TestConfigLoader:
             # Create invalid YAML
             config_path = Path(tmpdir) / ".validated-llm.yml"
             with open(config_path, "w") as f:
-                f.write("invalid: yaml: content:")
+                f.write(INVALID_YAML)
 
             loader = ConfigLoader()
             with pytest.raises(ValueError, match="Invalid config"):
                 loader.load_config(tmpdir)
 
-    def test_config_caching(self):
+    def test_config_caching(self, fake_config):
         """Test that config files are cached."""
+        fake_config({f"{FAKE_PROJECT}/.validated-llm.yml": {"llm_model": "cached-model"}})
+
+        loader = ConfigLoader()
+
+        # Load twice
+        config1 = loader.load_config(FAKE_PROJECT)
+        config2 = loader.load_config(FAKE_PROJECT)
+
+        # Should use cache (same config object)
+        assert config1 is config2
+
+    def test_load_config_from_file_path(self):
+        """Test that starting the search from a file finds the config beside it."""
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / ".validated-llm.yml"
-            config_data = {"llm_model": "cached-model"}
             with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+                yaml.dump({"llm_model": "sibling-model"}, f, Dumper=YamlSafeDumper)
+            source_file = Path(tmpdir) / "main.py"
+            source_file.write_text("")
 
-            loader = ConfigLoader()
+            config = ConfigLoader().load_config(source_file)
 
-            # Load twice
-            config1 = loader.load_config(tmpdir)
-            config2 = loader.load_config(tmpdir)
+            assert config.llm_model == "sibling-model"
 
-            # Should use cache (same config object)
-            assert config1 is config2
+    def test_config_file_parse_shared_across_loaders(self):
+        """Test that unchanged config files are parsed once across loaders."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".validated-llm.yml"
+            config_data = {"llm_model": "shared-model", "validator_defaults": {"EmailValidator": {"check_dns": True}}}
+            with open(config_path, "w") as f:
+                yaml.dump(config_data, f, Dumper=YamlSafeDumper)
 
-    def test_get_validator_config(self):
-        """Test getting validator-specific configuration."""
+            config1 = ConfigLoader().load_config(tmpdir)
+            hits = _parse_yaml_file.cache_info().hits
+            config2 = ConfigLoader().load_config(tmpdir)
+
+            assert _parse_yaml_file.cache_info().hits == hits + 1
+            assert config2.llm_model == "shared-model"
+
+            # Configs loaded from the cached parse don't share mutable state
+            config1.validator_defaults["EmailValidator"]["check_dns"] = False
+            assert config2.validator_defaults["EmailValidator"] == {"check_dns": True}
+
+    def test_config_file_reparsed_after_change(self):
+        """Test that editing a config file invalidates the parse cache."""
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / ".validated-llm.yml"
-            config_data = {"validator_defaults": {"EmailValidator": {"check_dns": True, "allow_smtputf8": False}, "JSONValidator": {"strict_mode": True}}}
             with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+                yaml.dump({"llm_model": "old-model"}, f, Dumper=YamlSafeDumper)
+            assert ConfigLoader().load_config(tmpdir).llm_model == "old-model"
 
-            loader = ConfigLoader()
-            loader.load_config(tmpdir)
+            with open(config_path, "w") as f:
+                yaml.dump({"llm_model": "updated-model"}, f, Dumper=YamlSafeDumper)
+            assert ConfigLoader().load_config(tmpdir).llm_model == "updated-model"
 
-            email_config = loader.get_validator_config("EmailValidator")
-            assert email_config == {"check_dns": True, "allow_smtputf8": False}
+    def test_get_validator_config(self, fake_config):
+        """Test getting validator-specific configuration."""
+        fake_config({f"{FAKE_PROJECT}/.validated-llm.yml": {"validator_defaults": {"EmailValidator": {"check_dns": True, "allow_smtputf8": False}, "JSONValidator": {"strict_mode": True}}}})
 
-            json_config = loader.get_validator_config("JSONValidator")
-            assert json_config == {"strict_mode": True}
+        loader = ConfigLoader()
+        loader.load_config(FAKE_PROJECT)
 
-            # Non-existent validator
-            other_config = loader.get_validator_config("OtherValidator")
-            assert other_config == {}
+        email_config = loader.get_validator_config("EmailValidator")
+        assert email_config == {"check_dns": True, "allow_smtputf8": False}
 
+        json_config = loader.get_validator_config("JSONValidator")
+        assert json_config == {"strict_mode": True}
 
-class TestConfigValidator:
-    """Test cases for ConfigValidator."""
+        # Non-existent validator
+        other_config = loader.get_validator_config("OtherValidator")
+        assert other_config == {}
 
-    def test_valid_config(self):
-        """Test validation of valid configuration."""
-        config_content = """
+
+VALID_CONFIG_YAML = """
 llm_model: gpt-4
 llm_temperature: 0.8
 max_retries: 5
@@ -233,128 +287,134 @@ task_defaults:
     language: python
 """
 
-        validator = ConfigValidator()
-        result = validator.validate(config_content)
+INVALID_YAML = "invalid: yaml: content:"
+
+UNKNOWN_KEYS_YAML = """
+llm_model: gpt-4
+unknown_key: some_value
+another_unknown: 123
+"""
+
+UNKNOWN_KEY_YAML = """
+llm_model: gpt-4
+unknown_key: some_value
+"""
+
+INVALID_TYPES_YAML = """
+llm_temperature: "not a number"
+max_retries: 3.5
+show_progress: "yes"
+validator_defaults: "not a dict"
+"""
+
+INVALID_TYPE_ERRORS = ["llm_temperature must be a number, got str", "max_retries must be an integer, got float", "show_progress must be a boolean, got str", "validator_defaults must be a dictionary"]
+
+OUT_OF_RANGE_YAML = """
+llm_temperature: 5.0
+max_retries: -1
+timeout_seconds: 0
+doc_min_sections: 0
+"""
+
+OUT_OF_RANGE_ERRORS = ["max_retries must be non-negative, got -1", "timeout_seconds must be positive, got 0", "doc_min_sections must be at least 1, got 0"]
+
+OUT_OF_RANGE_WARNING = "llm_temperature 5.0 is outside typical range [0, 2]"
+
+
+@pytest.fixture(scope="module")
+def lenient_validator():
+    """Default (lenient) config validator; it holds no per-call state so tests can share it."""
+    return ConfigValidator(strict_mode=False)
+
+
+@pytest.fixture(scope="module")
+def strict_validator():
+    """Config validator that rejects unknown keys, shared across tests."""
+    return ConfigValidator(strict_mode=True)
+
+
+class TestConfigValidator:
+    """Test cases for ConfigValidator."""
+
+    def test_valid_config(self, lenient_validator):
+        """Test validation of valid configuration."""
+        result = lenient_validator.validate(VALID_CONFIG_YAML)
 
         assert result.is_valid
         assert len(result.errors) == 0
 
-    def test_empty_config(self):
+    def test_empty_config(self, lenient_validator):
         """Test validation of empty configuration."""
-        validator = ConfigValidator()
-        result = validator.validate("")
+        result = lenient_validator.validate("")
 
         assert not result.is_valid
         assert "Configuration file is empty" in result.errors[0]
 
-    def test_invalid_yaml(self):
+    def test_invalid_yaml(self, lenient_validator):
         """Test validation of invalid YAML syntax."""
-        config_content = "invalid: yaml: content:"
-
-        validator = ConfigValidator()
-        result = validator.validate(config_content)
+        result = lenient_validator.validate(INVALID_YAML)
 
         assert not result.is_valid
         assert "Invalid YAML syntax" in result.errors[0]
 
-    def test_invalid_types(self):
+    def test_invalid_types(self, lenient_validator):
         """Test validation with incorrect types."""
-        config_content = """
-llm_temperature: "not a number"
-max_retries: 3.5
-show_progress: "yes"
-validator_defaults: "not a dict"
-"""
-
-        validator = ConfigValidator()
-        result = validator.validate(config_content)
+        result = lenient_validator.validate(INVALID_TYPES_YAML)
 
         assert not result.is_valid
-        assert any("llm_temperature must be a number" in error for error in result.errors)
-        assert any("max_retries must be an integer" in error for error in result.errors)
-        assert any("show_progress must be a boolean" in error for error in result.errors)
-        assert any("validator_defaults must be a dictionary" in error for error in result.errors)
+        # Set comparison reports missing and unexpected errors together
+        assert set(result.errors) == set(INVALID_TYPE_ERRORS)
 
-    def test_out_of_range_values(self):
+    def test_out_of_range_values(self, lenient_validator):
         """Test validation with out-of-range values."""
-        config_content = """
-llm_temperature: 5.0
-max_retries: -1
-timeout_seconds: 0
-doc_min_sections: 0
-"""
-
-        validator = ConfigValidator()
-        result = validator.validate(config_content)
+        result = lenient_validator.validate(OUT_OF_RANGE_YAML)
 
         assert not result.is_valid
-        assert any("temperature 5.0 is outside typical range" in warning for warning in result.warnings)
-        assert any("max_retries must be non-negative" in error for error in result.errors)
-        assert any("timeout_seconds must be positive" in error for error in result.errors)
-        assert any("doc_min_sections must be at least 1" in error for error in result.errors)
+        assert set(result.errors) == set(OUT_OF_RANGE_ERRORS)
+        assert result.warnings == [OUT_OF_RANGE_WARNING]
 
-    def test_unknown_keys_lenient(self):
+    def test_unknown_keys_lenient(self, lenient_validator):
         """Test handling of unknown keys in lenient mode."""
-        config_content = """
-llm_model: gpt-4
-unknown_key: some_value
-another_unknown: 123
-"""
-
-        validator = ConfigValidator(strict_mode=False)
-        result = validator.validate(config_content)
+        result = lenient_validator.validate(UNKNOWN_KEYS_YAML)
 
         assert result.is_valid  # Should be valid in lenient mode
         assert any("Unknown configuration keys" in warning for warning in result.warnings)
 
-    def test_unknown_keys_strict(self):
+    def test_unknown_keys_strict(self, strict_validator):
         """Test handling of unknown keys in strict mode."""
-        config_content = """
-llm_model: gpt-4
-unknown_key: some_value
-"""
-
-        validator = ConfigValidator(strict_mode=True)
-        result = validator.validate(config_content)
+        result = strict_validator.validate(UNKNOWN_KEY_YAML)
 
         assert not result.is_valid  # Should be invalid in strict mode
         assert any("Unknown configuration keys" in error for error in result.errors)
 
-    def test_sample_config_is_valid(self):
+    def test_sample_config_is_valid(self, lenient_validator):
         """Test that the sample configuration is valid."""
-        sample_config = create_sample_config()
-
-        validator = ConfigValidator()
-        result = validator.validate(sample_config)
+        result = lenient_validator.validate(create_sample_config())
 
         assert result.is_valid
         assert len(result.errors) == 0
 
 
-def test_module_functions():
+def test_module_functions(fake_config):
     """Test module-level convenience functions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create config
-        config_path = Path(tmpdir) / ".validated-llm.yml"
-        config_data = {"llm_model": "test-model", "validator_defaults": {"TestValidator": {"setting": "value"}}}
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
-
-        # Test load_config
-        config = load_config(tmpdir)
-        assert config.llm_model == "test-model"
-
-        # Test get_config (should return cached)
-        config2 = get_config()
-        assert config2.llm_model == "test-model"
-
-        # Test get_validator_config
-        validator_config = get_validator_config("TestValidator")
-        assert validator_config == {"setting": "value"}
-
-        # Test get_task_config
-        task_config = get_task_config("NonExistentTask")
-        assert task_config == {}
+    project = f"{FAKE_PROJECT}/module-functions"
+    fake_config({f"{project}/.validated-llm.yml": {"llm_model": "test-model", "validator_defaults": {"TestValidator": {"setting": "value"}}}})
+
+    # Test load_config
+    config = load_config(project)
+    assert config.llm_model == "test-model"
+
+    # Test get_config (should return cached)
+    config2 = get_config()
+    assert config2.llm_model == "test-model"
+
+    # Test get_validator_config
+    validator_config = get_validator_config("TestValidator")
+    assert validator_config == {"setting": "value"}
+
+    # Test get_task_config
+    task_config = get_task_config("NonExistentTask")
+    assert task_config == {}
 
 
 if __name__ == "__main__":
@@ -118,15 +118,11 @@ class TestErrorFormatter:
         assert "📚 Documentation: https://example.com/docs" in formatted
 
     def test_format_error_severity_symbols(self):
-        error_error = EnhancedValidationError(category=ErrorCategory.SYNTAX, message="Error message", severity=ErrorSeverity.ERROR)
+        assert ErrorFormatter._SEVERITY_SYMBOLS == {ErrorSeverity.ERROR: "❌", ErrorSeverity.WARNING: "⚠️", ErrorSeverity.INFO: "ℹ️"}
+        assert set(ErrorFormatter._SEVERITY_SYMBOLS) == set(ErrorSeverity)
 
         warning_error = EnhancedValidationError(category=ErrorCategory.SYNTAX, message="Warning message", severity=ErrorSeverity.WARNING)
-
-        info_error = EnhancedValidationError(category=ErrorCategory.SYNTAX, message="Info message", severity=ErrorSeverity.INFO)
-
-        assert "❌" in ErrorFormatter.format_error(error_error, include_context=False)
-        assert "⚠️" in ErrorFormatter.format_error(warning_error, include_context=False)
-        assert "ℹ️" in ErrorFormatter.format_error(info_error, include_context=False)
+        assert ErrorFormatter.format_error(warning_error, include_context=False).startswith("⚠️ Warning message")
 
     def test_format_multiple_errors_single(self):
         error = EnhancedValidationError(category=ErrorCategory.SYNTAX, message="Single error")
@@ -226,6 +222,15 @@ class TestContextExtractor:
         assert ">>>   1: Line 1" in context  # Note the extra spaces
         assert "      2: Line 2" in context
 
+    def test_extract_line_context_long_text(self):
+        text = "\n".join(f"Line {i}" for i in range(1, 1001))
+
+        context = ContextExtractor.extract_line_context(text, 3, context_lines=1)
+        assert context.split("\n") == ["      2: Line 2", ">>>   3: Line 3", "      4: Line 4"]
+
+        context = ContextExtractor.extract_line_context(text, 1000, context_lines=1)
+        assert context.split("\n") == ["    999: Line 999", ">>> 1000: Line 1000"]
+
     def test_extract_json_path_context(self):
         data = {"users": [{"name": "John", "email": "john@example.com"}, {"name": "Jane", "email": "jane@example.com"}]}
 
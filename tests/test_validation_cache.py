@@ -2,6 +2,8 @@
 Tests for validation caching functionality.
 """
 
+import gc
+import threading
 import time
 from typing import Any, Dict
 
@@ -119,6 +121,93 @@ class TestValidationCache:
         assert stats["size"] <= 3
         assert stats["evictions"] > 0
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test eviction keeps entries that were read recently, whatever their insertion order."""
+        cache = ValidationCache(max_size=3)
+
+        result = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        for input_data in ("input1", "input2", "input3"):
+            cache.put("validator1", input_data, result)
+        cache.get("validator1", "input1")
+
+        cache.put("validator1", "input4", result)
+
+        assert [input_data for input_data in ("input1", "input2", "input3", "input4") if cache.get("validator1", input_data)] == ["input1", "input4"]
+
+    def test_cache_memory_usage_tracks_entries(self):
+        """Test memory usage follows puts, overwrites and clears."""
+        cache = ValidationCache(max_size=10)
+
+        result = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        cache.put("validator1", "input1", result)
+        cache.put("validator1", "input1", result)
+        cache.put("validator1", "input2", ValidationResult(is_valid=False, errors=["bad"], warnings=[], metadata={}))
+
+        assert cache.get_stats()["memory_usage_mb"] * 1024 * 1024 == 200 + 206
+
+        cache.clear()
+        assert cache.get_stats()["memory_usage_mb"] == 0
+
+    def test_weak_fallback_serves_evicted_results_still_referenced(self):
+        """Test evicted results come back while referenced elsewhere, and are dropped once collected."""
+        cache = ValidationCache(max_size=2, weak_fallback=True)
+
+        kept = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        cache.put("validator1", "input1", kept)
+        cache.put("validator1", "input2", ValidationResult(is_valid=False, errors=["bad"], warnings=[], metadata={}))
+        cache.put("validator1", "input3", ValidationResult(is_valid=True, errors=[], warnings=[], metadata={}))
+        assert cache.get_stats()["size"] <= 2
+        gc.collect()
+
+        assert cache.get("validator1", "input1") is kept
+        assert cache.get("validator1", "input2") is None
+        stats = cache.get_stats()
+        assert stats["weak_hits"] == 1
+        assert stats["memory_usage_mb"] * 1024 * 1024 == 200 * stats["size"]
+
+    def test_weak_fallback_respects_ttl(self):
+        """Test an evicted result is not served past its original deadline."""
+        cache = ValidationCache(max_size=1, ttl_seconds=0.05, weak_fallback=True)
+
+        kept = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        cache.put("validator1", "input1", kept)
+        cache.put("validator1", "input2", ValidationResult(is_valid=True, errors=[], warnings=[], metadata={}))
+        time.sleep(0.1)
+
+        assert cache.get("validator1", "input1") is None
+
+    def test_weak_fallback_cleared(self):
+        """Test clear() also forgets evicted results."""
+        cache = ValidationCache(max_size=1, weak_fallback=True)
+
+        kept = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        cache.put("validator1", "input1", kept)
+        cache.put("validator1", "input2", ValidationResult(is_valid=True, errors=[], warnings=[], metadata={}))
+        cache.clear()
+
+        assert cache.get("validator1", "input1") is None
+
+    def test_cache_concurrent_access(self):
+        """Test concurrent puts and gets keep size and memory accounting consistent."""
+        cache = ValidationCache(max_size=50, cleanup_interval=10)
+        result = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+
+        def worker(worker_id):
+            for i in range(200):
+                cache.put("validator1", f"input{(worker_id * 7 + i) % 80}", result)
+                cache.get("validator1", f"input{i % 80}")
+
+        threads = [threading.Thread(target=worker, args=(worker_id,)) for worker_id in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["size"] <= 50
+        assert stats["memory_usage_mb"] * 1024 * 1024 == 200 * stats["size"]
+        assert stats["hits"] + stats["misses"] == 8 * 200
+
     def test_cache_context_handling(self):
         """Test that context is properly included in cache keys."""
         cache = ValidationCache(max_size=10)
@@ -137,6 +226,16 @@ class TestValidationCache:
         assert cached1.metadata["context"] == "1"
         assert cached2.metadata["context"] == "2"
 
+    def test_cache_context_with_nested_values(self):
+        """Test contexts holding lists and dicts are keyed by value, regardless of key order."""
+        cache = ValidationCache(max_size=10)
+
+        result = ValidationResult(is_valid=True, errors=[], warnings=[], metadata={})
+        cache.put("validator1", "input1", result, {"allowed": [1, 2], "limits": {"min": 0, "max": 5}})
+
+        assert cache.get("validator1", "input1", {"limits": {"max": 5, "min": 0}, "allowed": [1, 2]}) is result
+        assert cache.get("validator1", "input1", {"allowed": [2, 1], "limits": {"min": 0, "max": 5}}) is None
+
     def test_global_cache_functions(self):
         """Test global cache management functions."""
         # Configure global cache
@@ -241,6 +340,28 @@ class TestCachedValidatorMixin:
         assert first_call_time > 0.04, f"Expected first call > 40ms, got {first_call_time*1000:.1f}ms"
         assert second_call_time < 0.01, f"Expected second call < 10ms, got {second_call_time*1000:.1f}ms"
 
+    def test_cache_ttl_override(self):
+        """Test a validator's cache_ttl overrides the cache's own TTL for its entries."""
+
+        class CachedTestValidator(CachedValidatorMixin, SimpleTestValidator):
+            def __init__(self):
+                SimpleTestValidator.__init__(self)
+                CachedValidatorMixin.__init__(self, cache_instance=ValidationCache(ttl_seconds=3600.0), cache_ttl=0.05)
+
+            def _validate_uncached(self, output: str, context=None):
+                return SimpleTestValidator.validate(self, output, context)
+
+        validator = CachedTestValidator()
+
+        validator.validate("test input")
+        validator.validate("test input")
+        assert validator.call_count == 1
+
+        time.sleep(0.1)
+
+        validator.validate("test input")
+        assert validator.call_count == 2
+
     def test_cache_stats(self):
         """Test cache statistics tracking."""
 
@@ -302,6 +423,18 @@ class TestCachedValidatorMixin:
         assert "CachedTestValidator1" in id1
         assert "CachedTestValidator2" in id2
 
+    def test_validator_id_computed_once(self):
+        """Test the validator ID is built on first use and reused afterwards."""
+        from validated_llm.validators import FastJSONSchemaValidator
+
+        validator = FastJSONSchemaValidator({"type": "object"})
+
+        validator_id = validator._get_validator_id()
+
+        # The schema is assigned after the mixin's __init__, so it must still be part of the ID
+        assert "schema:" in validator_id
+        assert validator._get_validator_id() is validator_id
+
 
 class TestMakeCachedValidator:
     """Test the make_cached_validator factory function."""
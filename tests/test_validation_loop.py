@@ -0,0 +1,172 @@
+"""
+Tests for ValidationLoop using a scripted LLM provider.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from validated_llm import ValidationLoop, ValidationResult
+from validated_llm.llm_providers import LLMProvider, OllamaProvider
+from validated_llm.tasks.story_to_scenes import StoryToScenesValidator
+
+
+def split_chunks(text, size=16):
+    """Split a response into stream-sized pieces."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class ScriptedProvider(LLMProvider):
+    """Provider that returns canned responses, recording how much of each stream was read."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.generate_calls = 0
+        self.user_messages = []
+        self.chunks_read = []
+        self.closed = []
+
+    def generate(self, system_prompt, user_message):
+        self.generate_calls += 1
+        self.user_messages.append(user_message)
+        return self.responses.pop(0)
+
+    def generate_stream(self, system_prompt, user_message):
+        self.user_messages.append(user_message)
+        self.chunks_read.append(0)
+        self.closed.append(False)
+        try:
+            for chunk in split_chunks(self.responses.pop(0)):
+                self.chunks_read[-1] += 1
+                yield chunk
+        finally:
+            self.closed[-1] = True
+
+
+class BufferedProvider(LLMProvider):
+    """Provider relying on the default single-chunk generate_stream."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def generate(self, system_prompt, user_message):
+        return self.responses.pop(0)
+
+
+def require_corrected_prefix(output, context=None):
+    """Stateless validator: the answer depends only on the output, so it is safe to share."""
+    if output.startswith("CORRECTED:"):
+        return ValidationResult(is_valid=True, errors=[])
+    return ValidationResult(is_valid=False, errors=["Output must start with 'CORRECTED:' prefix"])
+
+
+@pytest.fixture
+def validator():
+    return StoryToScenesValidator()
+
+
+@pytest.fixture
+def fenced_output(story_scenes_output):
+    """The hand-written scenes YAML from tests/fixtures/story_scenes.yaml, wrapped in a markdown code block."""
+    return "```yaml\n" + story_scenes_output + "```"
+
+
+def test_retry_prompt_carries_validation_feedback():
+    """Test a failed attempt's errors are sent back with the retry request."""
+    provider = ScriptedProvider(["First draft", "CORRECTED: Second draft"])
+    loop = ValidationLoop(llm_provider=provider, default_max_retries=3)
+
+    result = loop.execute(prompt_template="Write about {topic}", validator=require_corrected_prefix, input_data={"topic": "cats"})
+
+    assert result["success"]
+    assert result["attempts"] == 2
+    assert result["output"] == "CORRECTED: Second draft"
+    assert provider.user_messages[0] == "Write about cats"
+    assert "Output must start with 'CORRECTED:' prefix" in provider.user_messages[1]
+
+
+def test_stream_stops_at_first_failed_chunk(validator, story_scenes_output, fenced_output):
+    """Test a fenced response is cut off after its first chunk and retried."""
+    provider = ScriptedProvider([fenced_output, story_scenes_output])
+    loop = ValidationLoop(llm_provider=provider, default_max_retries=2)
+
+    result = loop.execute(prompt_template="{story}", validator=validator, input_data={"story": "A cat sat on a mat."}, stream=True, debug=True)
+
+    assert result["success"]
+    assert result["attempts"] == 2
+    assert result["output"] == story_scenes_output.strip()
+    assert provider.chunks_read == [1, len(split_chunks(story_scenes_output))]
+    assert provider.closed == [True, True]
+    assert result["debug_info"][0]["raw_response"] == fenced_output[:16]
+    assert provider.generate_calls == 0
+
+
+def test_stream_failure_feedback_uses_partial_result(validator, fenced_output):
+    """Test the early failure is reported as the final validation result."""
+    provider = ScriptedProvider([fenced_output])
+    loop = ValidationLoop(llm_provider=provider, default_max_retries=1)
+
+    result = loop.execute(prompt_template="{story}", validator=validator, input_data={"story": "A cat sat on a mat."}, stream=True)
+
+    assert not result["success"]
+    assert result["validation_result"].errors == ["Output is wrapped in a markdown code block - return the raw YAML list without backticks"]
+
+
+def test_stream_falls_back_to_generate(validator, story_scenes_output):
+    """Test providers without streaming support still work with stream=True."""
+    loop = ValidationLoop(llm_provider=BufferedProvider([story_scenes_output]), default_max_retries=1)
+
+    result = loop.execute(prompt_template="{story}", validator=validator, input_data={"story": "A cat sat on a mat."}, stream=True)
+
+    assert result["success"]
+    assert result["output"] == story_scenes_output.strip()
+
+
+def test_buffered_by_default(validator, fenced_output):
+    """Test responses are generated in one request unless streaming is asked for."""
+    provider = ScriptedProvider([fenced_output])
+    loop = ValidationLoop(llm_provider=provider, default_max_retries=1)
+
+    result = loop.execute(prompt_template="{story}", validator=validator, input_data={"story": "A cat sat on a mat."})
+
+    assert not result["success"]
+    assert provider.generate_calls == 1
+    assert provider.chunks_read == []
+    assert result["validation_result"].errors[0].startswith("Invalid YAML syntax")
+
+
+class FakeStream:
+    """Stand-in for the OpenAI client's streaming response."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    def close(self):
+        self.closed = True
+
+
+def test_ollama_stream_closed_with_generator():
+    """Test closing Ollama's chunk generator closes the underlying response."""
+    provider = OllamaProvider(model="test-model")
+    stream = FakeStream(["- id", None, ": 1", "\n"])
+    requests = []
+
+    def create(**params):
+        requests.append(params)
+        return stream
+
+    provider.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    chunks = provider.generate_stream("system", "user")
+    assert next(chunks) == "- id"
+    assert next(chunks) == ": 1"
+    chunks.close()
+
+    assert stream.closed
+    assert requests[0]["stream"] is True
+    assert requests[0]["messages"][1] == {"role": "user", "content": "user"}
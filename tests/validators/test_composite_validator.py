@@ -120,6 +120,82 @@ class TestCompositeValidator:
         assert validator1.validate_calls == 1
         assert validator2.validate_calls == 0  # Should not be called due to short-circuit
 
+    def test_reorder_runs_cheapest_first(self):
+        """Test reordering lets a cheap failing validator settle AND before an expensive one runs."""
+        expensive = MockValidator(True, metadata={"kind": "expensive"}, description="Expensive")
+        expensive.cost_hint = 10.0
+        cheap = MockValidator(False, errors=["Cheap check failed"], description="Cheap")
+
+        composite = CompositeValidator([expensive, cheap], LogicOperator.AND, short_circuit=True, reorder=True)
+        result = composite.validate("test content")
+
+        assert not result.is_valid
+        assert expensive.validate_calls == 0
+        assert cheap.validate_calls == 1
+        # Labels still refer to the validators' positions as given
+        assert result.errors == ["Validator 2: Cheap check failed"]
+        assert composite.validators == [expensive, cheap]
+
+    def test_reorder_needs_short_circuit(self):
+        """Test validators run in the given order when every one of them runs anyway."""
+        expensive = MockValidator(False, errors=["Expensive check failed"], description="Expensive")
+        expensive.cost_hint = 10.0
+        cheap = MockValidator(False, errors=["Cheap check failed"], description="Cheap")
+
+        composite = CompositeValidator([expensive, cheap], LogicOperator.AND, short_circuit=False, reorder=True)
+        result = composite.validate("test content")
+
+        assert result.errors == ["Validator 1: Expensive check failed", "Validator 2: Cheap check failed"]
+
+    def test_batch_and_all_valid(self):
+        """Test a batch runs each validator once per output and matches validate()."""
+        validator1 = MockValidator(True, description="Validator 1")
+        validator2 = MockValidator(True, description="Validator 2")
+        outputs = ["first", "second", "third"]
+
+        composite = CompositeValidator([validator1, validator2], LogicOperator.AND)
+        results = composite.validate_batch(outputs)
+
+        assert len(results) == 3
+        assert all(result.is_valid for result in results)
+        assert validator1.validate_calls == 3
+        assert validator2.validate_calls == 3
+        assert results[0] == composite.validate("first")
+
+    def test_batch_short_circuit_prunes_decided_outputs(self):
+        """Test outputs that already failed an AND are not passed to later validators."""
+        first = Mock()
+        first.validate.side_effect = lambda output, context=None: ValidationResult(is_valid=output != "bad", errors=[] if output != "bad" else ["Bad output"])
+        second = MockValidator(False, errors=["Second check failed"], description="Validator 2")
+
+        composite = CompositeValidator([first, second], LogicOperator.AND, short_circuit=True)
+        results = composite.validate_batch(["good", "bad", "fine"])
+
+        assert second.validate_calls == 2
+        assert results[1].errors == ["Validator 1: Bad output"]
+        assert results[1].metadata["operation"]["results_count"] == 1
+        assert results == [composite.validate(output) for output in ["good", "bad", "fine"]]
+
+    def test_batch_exception_handling(self):
+        """Test an exception only affects the output that raised it."""
+
+        def reject_empty(output, context=None):
+            if not output:
+                raise ValueError("Empty output")
+            return ValidationResult(is_valid=True, errors=[])
+
+        validator1 = Mock()
+        validator1.validate.side_effect = reject_empty
+        validator2 = MockValidator(True, description="Validator 2")
+
+        composite = CompositeValidator([validator1, validator2], LogicOperator.OR, short_circuit=False)
+        results = composite.validate_batch(["content", ""])
+
+        assert results[0].is_valid and not results[0].errors
+        assert results[1].is_valid
+        assert results[1].errors == ["Validator 1 failed with exception: Empty output"]
+        assert validator2.validate_calls == 2
+
     def test_warnings_aggregation(self):
         """Test that warnings are properly aggregated."""
         validator1 = MockValidator(True, warnings=["Warning 1"], description="Validator 1")
@@ -180,3 +180,13 @@ class TestJSONSchemaValidator:
         assert '"type": "object"' in description
         assert '"required"' in description
         assert '"id"' in description
+
+    def test_compiled_schema_shared(self):
+        """Test that equal schemas reuse one compiled validator."""
+        first = JSONSchemaValidator({"type": "object", "required": ["id"]})
+        second = JSONSchemaValidator({"required": ["id"], "type": "object"})
+        unchecked = JSONSchemaValidator({"type": "object", "required": ["id"]}, format_checker=False)
+
+        assert first.validator is second.validator
+        assert unchecked.validator is not first.validator
+        assert not second.validate("{}").is_valid
@@ -11,10 +11,51 @@ This module analyzes prompt text to identify:
 import json
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 from .template_library import PromptTemplate, TemplateLibrary
 
+# Template variables like {variable}. More strict than \{(\w+)\} to avoid
+# matching JSON content: names must start with a letter or underscore (not a
+# number) and may not contain special regex characters like *, [], .
+# Double braces {{}} are escaped braces, not variables: the opening brace
+# must end an odd-length run of "{" and must not be followed by "}}", so the
+# prompt is scanned as-is without rewriting it first
+_TEMPLATE_VAR_RE = re.compile(r"(?<!\{)(?:\{\{)*\{([a-zA-Z_\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff][a-zA-Z0-9_\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]*)\}(?!\})")
+
+# Any {...} placeholder, masked out before output format detection
+_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+
+# Sentence boundaries used when collecting validation hints
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+# Phrases that signal the prompt includes an example of the expected output,
+# merged into one case-insensitive alternation so the prompt is scanned once
+_EXAMPLE_INDICATOR_RE = re.compile("|".join(re.escape(indicator) for indicator in ["example:", "for example", "like:", "such as", "```", "sample:", "output:", "format:"]), re.IGNORECASE)
+
+# First list item ("1. item", "* item" or "- item") on any line, with the
+# surrounding whitespace excluded from the captured item text
+_LIST_ITEM_RE = re.compile(r"^[^\S\n]*(?:\d+\.|\*|-)[^\S\n]*(\S(?:[^\n]*\S)?)[^\S\n]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _find_template_variables(prompt_text: str) -> Tuple[str, ...]:
+    """
+    Find the unique template variables in a prompt, in order of first use.
+
+    Returns an immutable tuple so results can be cached per prompt text.
+    """
+    # The pattern only admits non-empty names without whitespace, quotes,
+    # colons or commas, so matches just need order-preserving dedup
+    return tuple(dict.fromkeys(_TEMPLATE_VAR_RE.findall(prompt_text)))
+
+
+@lru_cache(maxsize=32)
+def _compile_indicators(indicators: Tuple[str, ...]) -> Tuple[Pattern[str], ...]:
+    """Compile an indicator table once into case-insensitive patterns, keyed by its contents."""
+    return tuple(re.compile(indicator, re.IGNORECASE) for indicator in indicators)
+
 
 @dataclass
 class AnalysisResult:
@@ -169,27 +210,7 @@ class PromptAnalyzer:
 
     def _extract_template_variables(self, prompt_text: str) -> List[str]:
         """Extract template variables like {variable} from prompt."""
-        # First, replace double braces {{}} with placeholders to ignore them
-        # This handles escaped braces that shouldn't be treated as variables
-        text = prompt_text.replace("{{", "<<DOUBLE_OPEN>>").replace("}}", "<<DOUBLE_CLOSE>>")
-
-        # More strict pattern to avoid matching JSON content
-        # Allow alphanumeric, underscore, and Unicode word characters
-        # But must start with a letter or underscore (not a number)
-        # Don't allow special regex characters like *, [], .
-        pattern = r"\{([a-zA-Z_\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff][a-zA-Z0-9_\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]*)\}"
-        matches = re.findall(pattern, text)
-
-        # Clean up variable names and remove duplicates
-        variables = []
-        for match in matches:
-            var_name = match.strip()
-            if var_name and var_name not in variables:
-                # Skip if it looks like JSON property (contains quotes or colons)
-                if '"' not in var_name and ":" not in var_name and "," not in var_name:
-                    variables.append(var_name)
-
-        return variables
+        return list(_find_template_variables(prompt_text))
 
     def _detect_output_format(self, prompt_text: str) -> tuple[str, float]:
         """
@@ -200,13 +221,13 @@ class PromptAnalyzer:
         """
         # Remove template variables from text to avoid false positives
         # Replace {variable_name} with placeholder to not trigger format detection
-        text_without_vars = re.sub(r"\{[^}]+\}", "VAR", prompt_text)
-        text_lower = text_without_vars.lower()
+        text_without_vars = _PLACEHOLDER_RE.sub("VAR", prompt_text)
 
-        # Count indicators for each format
-        json_score = self._count_indicators(text_lower, self.json_indicators)
-        csv_score = self._count_indicators(text_lower, self.csv_indicators)
-        list_score = self._count_indicators(text_lower, self.list_indicators)
+        # Count indicators for each format (matching is case-insensitive,
+        # so there is no need to lowercase a copy of the whole prompt)
+        json_score = self._count_indicators(text_without_vars, self.json_indicators)
+        csv_score = self._count_indicators(text_without_vars, self.csv_indicators)
+        list_score = self._count_indicators(text_without_vars, self.list_indicators)
 
         # Determine format based on highest score
         max_score = max(json_score, csv_score, list_score)
@@ -225,11 +246,7 @@ class PromptAnalyzer:
 
     def _count_indicators(self, text: str, indicators: List[str]) -> int:
         """Count how many indicators are found in text."""
-        count = 0
-        for indicator in indicators:
-            if re.search(indicator, text, re.IGNORECASE):
-                count += 1
-        return count
+        return sum(1 for pattern in _compile_indicators(tuple(indicators)) if pattern.search(text))
 
     def _extract_json_schema(self, prompt_text: str) -> Optional[Dict[str, Any]]:
         """
@@ -456,51 +473,29 @@ class PromptAnalyzer:
 
     def _extract_list_pattern(self, prompt_text: str) -> Optional[str]:
         """Extract list item pattern from prompt."""
-        # Look for list examples
-        list_patterns = [
-            r"^\d+\.\s*(.+)$",  # 1. item
-            r"^\*\s*(.+)$",  # * item
-            r"^-\s*(.+)$",  # - item
-        ]
-
-        lines = prompt_text.split("\n")
-        patterns_found = []
-
-        for line in lines:
-            line = line.strip()
-            for pattern in list_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    patterns_found.append(match.group(1))
-
-        if patterns_found:
-            # Return the most common pattern or first one
-            return patterns_found[0]
-
-        return None
+        # Single sweep over the whole prompt instead of splitting it into
+        # lines and trying each item pattern per line
+        match = _LIST_ITEM_RE.search(prompt_text)
+        return match.group(1) if match else None
 
     def _extract_validation_hints(self, prompt_text: str) -> List[str]:
         """Extract validation requirements from prompt text."""
-        hints = []
-        text_lower = prompt_text.lower()
+        hints: List[str] = []
+
+        # Split into sentences and lowercase each one once, rather than
+        # re-splitting and re-lowercasing the prompt for every keyword
+        sentences = [(sentence.strip(), sentence.lower()) for sentence in _SENTENCE_SPLIT_RE.split(prompt_text)]
 
         # Look for validation keywords and their context
         for keyword in self.validation_keywords:
-            if keyword in text_lower:
-                # Find sentences containing the keyword
-                sentences = re.split(r"[.!?]+", prompt_text)
-                for sentence in sentences:
-                    if keyword.lower() in sentence.lower():
-                        hints.append(sentence.strip())
+            keyword_lower = keyword.lower()
+            hints.extend(sentence for sentence, sentence_lower in sentences if keyword_lower in sentence_lower)
 
         return hints
 
     def _has_examples(self, prompt_text: str) -> bool:
         """Check if prompt contains examples of expected output."""
-        example_indicators = ["example:", "for example", "like:", "such as", "```", "sample:", "output:", "format:"]
-
-        text_lower = prompt_text.lower()
-        return any(indicator in text_lower for indicator in example_indicators)
+        return _EXAMPLE_INDICATOR_RE.search(prompt_text) is not None
 
     def _calculate_confidence(self, prompt_text: str, output_format: str, format_confidence: float, json_schema: Optional[Dict], csv_columns: Optional[List], list_pattern: Optional[str]) -> float:
         """Calculate overall confidence in the analysis."""
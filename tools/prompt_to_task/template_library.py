@@ -10,8 +10,16 @@ import json
 import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+@lru_cache(maxsize=256)
+def _normalize_template_text(text: str) -> Tuple[str, FrozenSet[str]]:
+    """Lowercase template text and collect its words, cached by text for repeated similarity searches."""
+    text_lower = text.lower()
+    return text_lower, frozenset(text_lower.split())
 
 
 @dataclass
@@ -611,10 +619,16 @@ class TemplateLibrary:
         """
         similarities = []
 
+        # Lowercase and tokenize the prompt once, not once per template.
+        # SequenceMatcher caches its analysis of the second sequence, so the
+        # prompt is set there once and only the template side changes
+        prompt_lower = prompt.lower()
+        prompt_words = set(prompt_lower.split())
+        seq_matcher = difflib.SequenceMatcher(None, b=prompt_lower)
+
         for template in self._templates.values():
             # Calculate similarity based on prompt template
-            template_words = set(template.prompt_template.lower().split())
-            prompt_words = set(prompt.lower().split())
+            template_lower, template_words = _normalize_template_text(template.prompt_template)
 
             # Jaccard similarity
             intersection = template_words.intersection(prompt_words)
@@ -622,7 +636,7 @@ class TemplateLibrary:
             jaccard_sim = len(intersection) / len(union) if union else 0
 
             # Also use difflib for sequence matching
-            seq_matcher = difflib.SequenceMatcher(None, template.prompt_template.lower(), prompt.lower())
+            seq_matcher.set_seq1(template_lower)
             seq_sim = seq_matcher.ratio()
 
             # Combined similarity
@@ -276,6 +276,9 @@ class ValidatorSuggester:
 class ListValidator(BaseValidator):
     """Validates list output format."""
 
+    # First characters that mark a list item ("-", "*" or a number)
+    LIST_MARKERS = frozenset('-*0123456789')
+
     def __init__(self, min_items: int = 1, max_items: int = 100, item_pattern: Optional[str] = None):
         super().__init__(name="list_validator", description="Validates list format and structure")
         self.min_items = min_items
@@ -286,7 +289,8 @@ class ListValidator(BaseValidator):
         errors = []
         warnings = []
 
-        lines = [line.strip() for line in content.strip().split('\\n') if line.strip()]
+        # Strip each line once, dropping blank ones
+        lines = [stripped for line in content.split('\\n') if (stripped := line.strip())]
 
         # Check item count
         if len(lines) < self.min_items:
@@ -296,8 +300,7 @@ class ListValidator(BaseValidator):
 
         # Check item format
         for i, line in enumerate(lines, 1):
-            if not (line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.', '*', '-')) or
-                    line[0].isdigit()):
+            if line[0] not in self.LIST_MARKERS and not line[0].isdigit():
                 warnings.append(f"Line {i} doesn't follow list format")
 
         return ValidationResult(